@@ -7,14 +7,20 @@ and perform basic operations.
 """
 
 import asyncio
-import json
 import sys
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 
+import orjson
+
 from sanctions_watch import EUSanctionsCrawler, OFACCrawler, UKTreasuryCrawler
 from sanctions_watch.core.models import EntityType
 
 
+_get_name = attrgetter("name")
+
+
 async def demo_single_crawler():
     """Demonstrate crawling from a single source."""
     print("🔍 Demo: Single Source Crawl (EU Sanctions)")
@@ -80,18 +86,13 @@ def analyze_results(results):
     print("\n📊 Analysis Summary")
     print("=" * 50)
     
-    total_entities = 0
-    entity_types = {}
-    sources = []
-    
-    for source_name, result in results.items():
-        sources.append(source_name)
-        total_entities += result.total_entities
-        
-        # Count entity types
-        for entity in result.entities:
-            entity_type = entity.entity_type
-            entity_types[entity_type] = entity_types.get(entity_type, 0) + 1
+    sources = list(results.keys())
+    total_entities = sum(result.total_entities for result in results.values())
+    entity_types = Counter(
+        entity.entity_type
+        for result in results.values()
+        for entity in result.entities
+    )
     
     print(f"📈 Total entities across all sources: {total_entities}")
     print(f"🌐 Sources crawled: {', '.join(sources)}")
@@ -120,11 +121,11 @@ def save_sample_data(results, output_file="sample_data.json"):
                 "name": entity.name,
                 "type": entity.entity_type,
                 "nationality": entity.nationality,
-                "sanctions_programs": [p.name for p in entity.sanctions_programs]
+                "sanctions_programs": list(map(_get_name, entity.sanctions_programs))
             })
     
-    with open(output_file, 'w') as f:
-        json.dump(sample_data, f, indent=2, default=str)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(sample_data, option=orjson.OPT_INDENT_2, default=str))
     
     print(f"   ✅ Saved {len(sample_data['sample_entities'])} sample entities")
 
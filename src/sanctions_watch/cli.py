@@ -1,30 +1,84 @@
 """Command-line interface for SanctionsWatch."""
 
 import asyncio
-import json
+import csv
+import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+import aiohttp
 import click
+import orjson
 import structlog
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
 from rich.panel import Panel
 
+from .core.base import shared_ssl_context
 from .core.models import CrawlResult, CrawlerConfig
 from .crawlers import EUSanctionsCrawler, OFACCrawler, UNSanctionsCrawler, UKTreasuryCrawler
-from .processors.normalizer import normalize_entities
-from .processors.deduplicator import deduplicate_entities
-from .processors.enricher import enrich_entities
+from .processors.pipeline import process_entities
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from rich.table import Table
 
 
 # Configure logging
 logger = structlog.get_logger(__name__)
 console = Console()
 
+# orjson options for exported JSON files
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+_JSONL_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+@lru_cache(maxsize=None)
+def _progress_columns() -> Tuple[Any, ...]:
+    """Progress bar columns, built on first use and shared by every crawl run."""
+    from rich.progress import SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    return (
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+    )
+
+
+# Table column specs: (header, style, justify, no_wrap)
+_RESULTS_TABLE_SPEC = (
+    ("Source", "cyan", "left", True),
+    ("Status", "green", "left", False),
+    ("Entities", "magenta", "right", False),
+    ("Errors", "red", "right", False),
+    ("Duration", "yellow", "right", False),
+)
+_QUALITY_TABLE_SPEC = (
+    ("Source", "cyan", "left", False),
+    ("Entities", None, "right", False),
+    ("With Address", None, "right", False),
+    ("With IDs", None, "right", False),
+    ("Avg Quality", None, "right", False),
+)
+_HEALTH_TABLE_SPEC = (
+    ("Source", "cyan", "left", False),
+    ("Status", "green", "left", False),
+    ("Base URL", "blue", "left", False),
+    ("Rate Limit", "yellow", "right", False),
+)
+
+
+def _new_table(title: str, spec: Tuple[Tuple[str, Optional[str], str, bool], ...]) -> "Table":
+    """Build a table with columns from a column spec."""
+    from rich.table import Table
+    
+    table = Table(title=title)
+    for header, style, justify, no_wrap in spec:
+        table.add_column(header, style=style, justify=justify, no_wrap=no_wrap)
+    return table
+
 
 # Crawler registry
 CRAWLERS = {
@@ -35,12 +89,78 @@ CRAWLERS = {
 }
 
 
+class EntityRow(NamedTuple):
+    """Flat per-entity record used by tabular exports (no per-row __dict__)."""
+    source: str
+    id: str
+    name: str
+    entity_type: str
+    sanction_status: str
+    nationality: Optional[str]
+    identifiers_count: int
+    addresses_count: int
+    data_quality_score: Optional[float]
+    last_updated: Optional[str]
+
+
+# Columns of the flat per-entity record used by tabular exports
+RECORD_FIELDS = list(EntityRow._fields)
+
+# Mock data file names inside --mock-data-dir
+MOCK_FILES = {
+    'eu-sanctions': 'eu.xml',
+    'ofac': 'ofac.xml',
+    'un-sanctions': 'un.xml',
+    'uk-treasury': 'uk.csv',
+}
+
+
+# structlog pipeline, built once at import time
+_LOG_PROCESSORS = (
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.processors.JSONRenderer(),
+)
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """Configure structlog on first use, at the level chosen on the command line.
+    
+    Only commands that actually log call this, so quick commands like
+    ``version`` and ``info`` skip logger setup entirely.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+        
+    ctx = click.get_current_context(silent=True)
+    level = ((ctx.find_root().obj if ctx else None) or {}).get('log_level', 'INFO')
+    logging.getLogger().setLevel(level)
+    
+    structlog.configure(
+        processors=list(_LOG_PROCESSORS),
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+    _logging_configured = True
+
+
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress all output except errors')
-def cli(verbose: bool, quiet: bool):
+@click.pass_context
+def cli(ctx: click.Context, verbose: bool, quiet: bool):
     """SanctionsWatch: Comprehensive sanctions data crawler framework."""
-    # Configure logging level
+    # Configure logging level; applied lazily by _configure_logging()
     if quiet:
         level = 'ERROR'
     elif verbose:
@@ -48,23 +168,7 @@ def cli(verbose: bool, quiet: bool):
     else:
         level = 'INFO'
         
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
-        ],
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-    )
+    ctx.obj = {'log_level': level}
 
 
 @cli.command()
@@ -72,7 +176,7 @@ def cli(verbose: bool, quiet: bool):
               type=click.Choice(list(CRAWLERS.keys()) + ['all']),
               default=['all'], help='Source(s) to crawl')
 @click.option('--output', '-o', type=click.Path(), help='Output file path')
-@click.option('--format', 'output_format', type=click.Choice(['json', 'csv', 'excel', 'sqlite']), 
+@click.option('--format', 'output_format', type=click.Choice(['json', 'jsonl', 'csv', 'excel', 'sqlite']), 
               default='json', help='Output format')
 @click.option('--rate-limit', type=float, default=2.0, 
               help='Rate limit in seconds between requests')
@@ -83,6 +187,7 @@ def cli(verbose: bool, quiet: bool):
 def crawl(source: List[str], output: Optional[str], output_format: str, 
           rate_limit: float, timeout: int, mock_data_dir: Optional[str]):
     """Crawl sanctions data from specified sources."""
+    _configure_logging()
     
     # Determine which sources to crawl
     if 'all' in source:
@@ -109,70 +214,85 @@ def crawl(source: List[str], output: Optional[str], output_format: str,
 
 
 async def _run_crawl(sources: List[str], rate_limit: float, timeout: int, mock_data_dir: Optional[str] = None) -> Dict[str, CrawlResult]:
-    """Run crawl for specified sources."""
-    results = {}
+    """Run crawl for specified sources concurrently."""
+    from rich.progress import Progress
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console
-    ) as progress:
-        
-        main_task = progress.add_task("Overall progress", total=len(sources))
-        
-        for source_name in sources:
-            crawler_class = CRAWLERS[source_name]
-            
-            # Create custom config with user settings
-            config = crawler_class.DEFAULT_CONFIG.copy()
-            config.rate_limit_seconds = rate_limit
-            config.timeout_seconds = timeout
-            
-            # If mock data directory provided, point crawler to local mock file
-            if mock_data_dir:
-                mock_map = {
-                    'eu-sanctions': 'eu.xml',
-                    'ofac': 'ofac.xml',
-                    'un-sanctions': 'un.xml',
-                    'uk-treasury': 'uk.csv',
-                }
-                filename = mock_map.get(source_name)
-                if filename:
-                    config.custom_settings['mock_file'] = str(Path(mock_data_dir) / filename)
+    # One connection pool for all crawlers so DNS lookups, TLS sessions and
+    # keep-alive connections are reused across sources
+    connector = aiohttp.TCPConnector(limit=256, limit_per_host=64, ttl_dns_cache=300,
+                                     ssl=shared_ssl_context())
+    
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Redraw at most 4x a second, and not at all when output is piped
+        with Progress(*_progress_columns(), console=console, transient=True,
+                      refresh_per_second=4, disable=not console.is_terminal) as progress:
             
-            crawler_task = progress.add_task(f"Crawling {source_name}", total=None)
+            main_task = progress.add_task("Overall progress", total=len(sources))
             
-            try:
-                async with crawler_class(config) as crawler:
-                    result = await crawler.crawl()
-                    # Post-processing: normalize, deduplicate, enrich
-                    processed = enrich_entities(deduplicate_entities(normalize_entities(result.entities)))
-                    result.entities = processed
-                    result.total_entities = len(processed)
-                    results[source_name] = result
-                    
-                progress.update(crawler_task, completed=True, description=f"✅ {source_name}")
-                
-            except Exception as e:
-                logger.error("Crawl failed", source=source_name, error=str(e))
-                progress.update(crawler_task, completed=True, description=f"❌ {source_name}")
-                
-            progress.advance(main_task)
+            pairs = await asyncio.gather(
+                *(_run_one(source_name, session, progress, main_task, rate_limit, timeout, mock_data_dir)
+                  for source_name in sources),
+                return_exceptions=True
+            )
+    
+    results = {}
+    for source_name, pair in zip(sources, pairs):
+        if isinstance(pair, BaseException):
+            logger.error("Crawl failed", source=source_name, error=str(pair))
+        elif pair[1] is not None:
+            results[source_name] = pair[1]
     
     return results
 
 
+async def _run_one(source_name: str, session: aiohttp.ClientSession, progress: "Progress", main_task: Any,
+                   rate_limit: float, timeout: int,
+                   mock_data_dir: Optional[str] = None) -> Tuple[str, Optional[CrawlResult]]:
+    """Crawl and post-process a single source."""
+    crawler_class = CRAWLERS[source_name]
+    
+    # Create custom config with user settings
+    defaults = crawler_class.DEFAULT_CONFIG
+    updates: Dict[str, Any] = {'rate_limit_seconds': rate_limit, 'timeout_seconds': timeout}
+    
+    # If mock data directory provided, point crawler to local mock file
+    if mock_data_dir:
+        filename = MOCK_FILES.get(source_name)
+        if filename:
+            updates['custom_settings'] = {
+                **defaults.custom_settings,
+                'mock_file': str(Path(mock_data_dir) / filename),
+            }
+            
+    config = defaults.model_copy(update=updates)
+    
+    crawler_task = progress.add_task(f"Crawling {source_name}", total=None)
+    result = None
+    
+    try:
+        async with crawler_class(config, session=session) as crawler:
+            result = await crawler.crawl()
+            # Post-processing: normalize, deduplicate, enrich
+            processed = list(process_entities(result.entities))
+            result.entities = processed
+            result.total_entities = result.success_count = len(processed)
+            
+        progress.update(crawler_task, completed=True, description=f"✅ {source_name}")
+        if progress.disable:
+            logger.info("Crawl finished", source=source_name, entities=result.total_entities)
+        
+    except Exception as e:
+        logger.error("Crawl failed", source=source_name, error=str(e))
+        progress.update(crawler_task, completed=True, description=f"❌ {source_name}")
+        result = None
+        
+    progress.advance(main_task)
+    return source_name, result
+
+
 def _display_results(results: Dict[str, CrawlResult]) -> None:
     """Display crawl results in a formatted table."""
-    table = Table(title="Crawl Results Summary")
-    
-    table.add_column("Source", style="cyan", no_wrap=True)
-    table.add_column("Status", style="green")
-    table.add_column("Entities", justify="right", style="magenta")
-    table.add_column("Errors", justify="right", style="red")
-    table.add_column("Duration", justify="right", style="yellow")
+    table = _new_table("Crawl Results Summary", _RESULTS_TABLE_SPEC)
     
     total_entities = 0
     total_errors = 0
@@ -210,84 +330,72 @@ def _save_results(results: Dict[str, CrawlResult], output_path: str, format: str
     output_file = Path(output_path)
     
     if format == 'json':
-        # Combine all entities
-        all_entities = []
-        for result in results.values():
-            for entity in result.entities:
-                all_entities.append(entity.dict())
-        
-        with open(output_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.utcnow().isoformat(),
+        # Combine all entities; orjson serializes datetimes and enums natively
+        all_entities = [
+            entity.to_dict()
+            for result in results.values()
+            for entity in result.entities
+        ]
+
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps({
+                'timestamp': datetime.utcnow(),
                 'total_entities': len(all_entities),
                 'sources': list(results.keys()),
                 'entities': all_entities
-            }, f, indent=2, default=str)
+            }, option=_JSON_OPTIONS, default=str))
+
+    elif format == 'jsonl':
+        # Stream one entity per line; the first line is a header record
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps({
+                'header': True,
+                'timestamp': datetime.utcnow(),
+                'total_entities': sum(len(result.entities) for result in results.values()),
+                'sources': list(results.keys()),
+            }, option=_JSONL_OPTIONS))
+            f.write(b"\n")
+            for result in results.values():
+                for entity in result.entities:
+                    f.write(orjson.dumps(entity.to_dict(), option=_JSONL_OPTIONS, default=str))
+                    f.write(b"\n")
             
     elif format == 'csv':
-        import pandas as pd
-        
-        # Convert entities to flat records
-        records = []
-        for source_name, result in results.items():
-            for entity in result.entities:
-                record = {
-                    'source': source_name,
-                    'id': entity.id,
-                    'name': entity.name,
-                    'entity_type': str(entity.entity_type),
-                    'sanction_status': str(entity.sanction_status),
-                    'nationality': entity.nationality,
-                    'identifiers_count': len(entity.identifiers),
-                    'addresses_count': len(entity.addresses),
-                    'data_quality_score': entity.data_quality_score,
-                    'last_updated': entity.last_updated.isoformat() if entity.last_updated else None,
-                }
-                records.append(record)
-        
-        pd.DataFrame(records).to_csv(output_file, index=False)
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(RECORD_FIELDS)
+            writer.writerows(_entity_records(results))
     
     elif format == 'excel':
         import pandas as pd
-        records = []
-        for source_name, result in results.items():
-            for entity in result.entities:
-                records.append({
-                    'source': source_name,
-                    'id': entity.id,
-                    'name': entity.name,
-                    'entity_type': str(entity.entity_type),
-                    'sanction_status': str(entity.sanction_status),
-                    'nationality': entity.nationality,
-                    'identifiers_count': len(entity.identifiers),
-                    'addresses_count': len(entity.addresses),
-                    'data_quality_score': entity.data_quality_score,
-                    'last_updated': entity.last_updated.isoformat() if entity.last_updated else None,
-                })
-        df = pd.DataFrame(records)
+        df = pd.DataFrame(_entity_records(results), columns=RECORD_FIELDS)
         with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
             df.to_excel(writer, index=False, sheet_name='entities')
     
     elif format == 'sqlite':
         import pandas as pd
         from sqlalchemy import create_engine
-        records = []
-        for source_name, result in results.items():
-            for entity in result.entities:
-                records.append({
-                    'source': source_name,
-                    'id': entity.id,
-                    'name': entity.name,
-                    'entity_type': str(entity.entity_type),
-                    'sanction_status': str(entity.sanction_status),
-                    'nationality': entity.nationality,
-                    'identifiers_count': len(entity.identifiers),
-                    'addresses_count': len(entity.addresses),
-                    'data_quality_score': entity.data_quality_score,
-                    'last_updated': entity.last_updated.isoformat() if entity.last_updated else None,
-                })
         engine = create_engine(f'sqlite:///{output_file}')
-        pd.DataFrame(records).to_sql('entities', engine, if_exists='replace', index=False)
+        df = pd.DataFrame(_entity_records(results), columns=RECORD_FIELDS)
+        df.to_sql('entities', engine, if_exists='replace', index=False)
+
+
+def _entity_records(results: Dict[str, CrawlResult]) -> Iterator[EntityRow]:
+    """Yield one flat record per entity for tabular exports."""
+    for source_name, result in results.items():
+        for entity in result.entities:
+            yield EntityRow(
+                source=source_name,
+                id=entity.id,
+                name=entity.name,
+                entity_type=str(entity.entity_type),
+                sanction_status=str(entity.sanction_status),
+                nationality=entity.nationality,
+                identifiers_count=len(entity.identifiers),
+                addresses_count=len(entity.addresses),
+                data_quality_score=entity.data_quality_score,
+                last_updated=entity.last_updated.isoformat() if entity.last_updated else None,
+            )
 
 
 @cli.command()
@@ -301,18 +409,14 @@ def _save_results(results: Dict[str, CrawlResult], output_path: str, format: str
               help='Directory containing mock data files for offline testing')
 def validate(source: str, rate_limit: float, timeout: int, mock_data_dir: Optional[str]):
     """Validate data quality for specified source."""
+    _configure_logging()
     console.print(f"🔍 Validating data quality for: {source}")
     
     sources_to_check = list(CRAWLERS.keys()) if source == 'all' else [source]
     # Run the same pipeline to get processed entities
     results = asyncio.run(_run_crawl(sources_to_check, rate_limit, timeout, mock_data_dir))
     
-    table = Table(title="Data Quality Metrics")
-    table.add_column("Source", style="cyan")
-    table.add_column("Entities", justify="right")
-    table.add_column("With Address", justify="right")
-    table.add_column("With IDs", justify="right")
-    table.add_column("Avg Quality", justify="right")
+    table = _new_table("Data Quality Metrics", _QUALITY_TABLE_SPEC)
     
     for src, res in results.items():
         total = len(res.entities)
@@ -329,17 +433,14 @@ def validate(source: str, rate_limit: float, timeout: int, mock_data_dir: Option
               default='all', help='Source to check health')
 def health(source: str):
     """Check health status of crawlers."""
+    _configure_logging()
     
     if source == 'all':
         sources_to_check = list(CRAWLERS.keys())
     else:
         sources_to_check = [source]
     
-    table = Table(title="Crawler Health Status")
-    table.add_column("Source", style="cyan")
-    table.add_column("Status", style="green")
-    table.add_column("Base URL", style="blue")
-    table.add_column("Rate Limit", justify="right", style="yellow")
+    table = _new_table("Crawler Health Status", _HEALTH_TABLE_SPEC)
     
     for source_name in sources_to_check:
         crawler_class = CRAWLERS[source_name]
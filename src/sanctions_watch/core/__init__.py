@@ -2,6 +2,7 @@
 
 from .base import BaseCrawler
 from .models import SanctionEntity, EntityType, CrawlResult, CrawlerConfig
+from .serialization import dump_crawl_result
 from .exceptions import (
     SanctionsWatchError, 
     CrawlerError, 
@@ -18,6 +19,7 @@ __all__ = [
     "EntityType", 
     "CrawlResult",
     "CrawlerConfig",
+    "dump_crawl_result",
     "SanctionsWatchError",
     "CrawlerError",
     "DataValidationError", 
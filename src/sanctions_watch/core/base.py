@@ -2,102 +2,272 @@
 
 import asyncio
 import logging
+import multiprocessing
+import ssl
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict, Any, AsyncGenerator
+from functools import lru_cache, partial
+from itertools import chain
+from typing import AsyncIterator, List, Optional, Dict, Any
 import time
 
 import aiohttp
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from .models import SanctionEntity, CrawlResult, CrawlerConfig
-from .exceptions import CrawlerError, RateLimitError, DataValidationError
+from .exceptions import CrawlerError, RateLimitError
+from .streaming import CHUNK_SIZE
 
 
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def shared_ssl_context() -> ssl.SSLContext:
+    """Return one verifying SSL context shared by all connectors.
+    
+    The CA bundle is loaded once, on first use, and TLS sessions can be
+    resumed across crawlers.
+    """
+    return ssl.create_default_context()
+
+
+def _parse_batch(crawler_class: type, config: CrawlerConfig, batch: List[Any]) -> List[SanctionEntity]:
+    """Parse one batch of packed raw items in a worker process."""
+    return crawler_class(config)._parse_packed(batch)
+
+
 class BaseCrawler(ABC):
     """Abstract base class for all sanctions data crawlers."""
     
-    def __init__(self, config: CrawlerConfig):
-        """Initialize the crawler with configuration."""
+    # Lists at least this long are parsed in a process pool, in batches of
+    # PARSE_BATCH_SIZE so pickling doesn't dominate the transfer
+    PARALLEL_PARSE_MIN_ITEMS = 2000
+    PARSE_BATCH_SIZE = 1000
+    
+    # Sources whose entities need follow-up I/O (e.g. detail pages) set
+    # ASYNC_PARSE and override _parse_entity_async
+    ASYNC_PARSE = False
+    PARSE_CONCURRENCY = 64
+    
+    def __init__(self, config: CrawlerConfig, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize the crawler with configuration.
+        
+        If ``session`` is given it is shared with other crawlers: it is used
+        as-is and never closed by this crawler.
+        """
         self.config = config
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._headers = {
+            'User-Agent': config.user_agent,
+            **config.headers
+        }
         self.last_request_time = 0.0
+        self._request_count = 0
         self.logger = logger.bind(source=config.source)
+        self._mock_file: Optional[str] = config.custom_settings.get('mock_file')
+        
+        # Parse worker processes, started on the first large batch and kept
+        # until the crawler is closed
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._in_context = False
+        
+        # Token bucket: one request per rate_limit_seconds until the server
+        # advertises its own limits via X-RateLimit-* headers
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._bucket_capacity = 1.0
+        self._refill_rate = 1.0 / config.rate_limit_seconds if config.rate_limit_seconds > 0 else 0.0
+        self._tokens = self._bucket_capacity
+        self._refill_at = 0.0
+        self._blocked_until = 0.0
         
     async def __aenter__(self):
         """Async context manager entry."""
-        await self._create_session()
+        if not self.session:
+            await self._create_session()
+        self._in_context = True
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        self._in_context = False
         await self._close_session()
+        await self._shutdown_pool()
         
     async def _create_session(self) -> None:
         """Create HTTP session with proper configuration."""
         timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-        connector = aiohttp.TCPConnector(verify_ssl=self.config.verify_ssl)
-        
-        headers = {
-            'User-Agent': self.config.user_agent,
-            **self.config.headers
-        }
+        connector = aiohttp.TCPConnector(
+            ssl=shared_ssl_context() if self.config.verify_ssl else False,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+        )
         
         self.session = aiohttp.ClientSession(
             timeout=timeout,
             connector=connector,
-            headers=headers
+            headers=self._headers
         )
+        self._owns_session = True
         
     async def _close_session(self) -> None:
-        """Close HTTP session."""
-        if self.session:
+        """Close HTTP session if this crawler created it."""
+        if self.session and self._owns_session:
             await self.session.close()
             self.session = None
             
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the in-flight request semaphore, created on first use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        return self._semaphore
+        
     async def _rate_limit(self) -> None:
-        """Implement rate limiting between requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        """Take a token from the rate limit bucket, sleeping if it is empty."""
+        if self.config.rate_limit_seconds <= 0 and not self._blocked_until:
+            return
+            
+        # Monotonic, and cheaper than a wall-clock read
+        loop = asyncio.get_running_loop()
+        current_time = loop.time()
+        
+        # Refill based on elapsed time; tokens may go negative so that
+        # concurrent callers queue up behind each other
+        if self._refill_at:
+            elapsed = current_time - self._refill_at
+            self._tokens = min(self._bucket_capacity, self._tokens + elapsed * self._refill_rate)
+        self._refill_at = current_time
+        self._tokens -= 1
         
-        if time_since_last_request < self.config.rate_limit_seconds:
-            sleep_time = self.config.rate_limit_seconds - time_since_last_request
+        sleep_time = max(self._blocked_until - current_time, 0.0)
+        if self._tokens < 0 and self._refill_rate > 0:
+            sleep_time = max(sleep_time, -self._tokens / self._refill_rate)
+            
+        if sleep_time > 0:
             self.logger.debug("Rate limiting", sleep_time=sleep_time)
             await asyncio.sleep(sleep_time)
             
-        self.last_request_time = time.time()
+        self.last_request_time = loop.time()
+        
+    def _update_rate_limit(self, headers: Any) -> None:
+        """Resize the token bucket from X-RateLimit-* and Retry-After response headers."""
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                self._blocked_until = asyncio.get_running_loop().time() + max(float(retry_after), 0.0)
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential back-off
+                
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+            
+        try:
+            remaining = int(float(remaining))
+            window = float(reset)
+        except ValueError:
+            return
+            
+        # Some servers send an epoch timestamp rather than a delay
+        wall_time = time.time()
+        if window > wall_time / 2:
+            window -= wall_time
+        window = max(window, 0.0)
+        current_time = asyncio.get_running_loop().time()
         
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((aiohttp.ClientError, RateLimitError))
-    )
+        if remaining <= 0:
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = current_time + window
+        elif window > 0:
+            self._bucket_capacity = float(min(remaining, self.config.max_concurrent))
+            self._refill_rate = remaining / window
+            self._tokens = min(self._tokens, self._bucket_capacity)
+            self._blocked_until = 0.0
+            
     async def _make_request(self, url: str, **kwargs) -> aiohttp.ClientResponse:
         """Make HTTP request with retry logic and rate limiting."""
         if not self.session:
             raise CrawlerError("Session not initialized. Use async context manager.")
             
-        await self._rate_limit()
-        
-        self.logger.info("Making request", url=url)
+        # Exponential back-off between attempts: 4s, 8s, then capped at 10s.
+        # A Retry-After header blocks the token bucket, so _rate_limit waits
+        # out any remainder on the next attempt.
+        attempts = max(self.config.max_retries, 1)
+        delay = 4.0
+        for attempt in range(attempts):
+            try:
+                return await self._request_once(url, **kwargs)
+            except (aiohttp.ClientError, RateLimitError):
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(min(delay, 10.0))
+                delay *= 2
+                
+        raise CrawlerError(f"Request failed for {url}")
         
-        try:
-            response = await self.session.get(url, **kwargs)
+    async def _request_once(self, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """Make a single rate-limited HTTP request."""
+        async with self._get_semaphore():
+            await self._rate_limit()
+            
+            # Per-request lines are debug-only; a sampled info line shows progress
+            self.logger.debug("Making request", url=url)
+            self._request_count += 1
+            if not self._request_count & 0x3FF:
+                self.logger.info("Request progress", requests=self._request_count)
             
-            if response.status == 429:
-                raise RateLimitError(f"Rate limit exceeded for {url}")
-            elif response.status >= 400:
-                response.raise_for_status()
+            if not self._owns_session:
+                # Shared sessions carry no per-crawler defaults
+                kwargs.setdefault('headers', self._headers)
+                kwargs.setdefault('timeout', aiohttp.ClientTimeout(total=self.config.timeout_seconds))
+                if not self.config.verify_ssl:
+                    kwargs.setdefault('ssl', False)
+                
+            try:
+                response = await self.session.get(url, **kwargs)
+                self._update_rate_limit(response.headers)
+                
+                if response.status == 429:
+                    response.release()
+                    raise RateLimitError(f"Rate limit exceeded for {url}")
+                elif response.status >= 400:
+                    response.raise_for_status()
+                    
+                return response
                 
-            return response
+            except aiohttp.ClientError as e:
+                self.logger.error("Request failed", url=url, error=str(e))
+                raise
+                
+    async def _read_chunks(self) -> AsyncIterator[bytes]:
+        """Yield the raw source document in chunks, from the mock file if configured."""
+        mock_file = self._mock_file
+        if mock_file:
+            # Disk reads run in the default executor so other crawlers sharing
+            # the event loop aren't stalled by a large file
+            loop = asyncio.get_running_loop()
+            f = await loop.run_in_executor(None, open, mock_file, 'rb')
+            try:
+                read = partial(f.read, CHUNK_SIZE)
+                while True:
+                    chunk = await loop.run_in_executor(None, read)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                f.close()
+            return
             
-        except aiohttp.ClientError as e:
-            self.logger.error("Request failed", url=url, error=str(e))
-            raise
+        response = await self._make_request(self.config.base_url)
+        try:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                yield chunk
+        finally:
+            response.release()
             
     @abstractmethod
     async def _fetch_data(self) -> Any:
@@ -110,29 +280,26 @@ class BaseCrawler(ABC):
         pass
         
     def _validate_entity(self, entity: SanctionEntity) -> bool:
-        """Validate a parsed entity."""
-        try:
-            # Basic validation - entity must have name and valid type
-            if not entity.name or not entity.name.strip():
-                raise DataValidationError("Entity name is required")
-                
-            if not entity.id or not entity.id.strip():
-                raise DataValidationError("Entity ID is required")
-                
-            if not entity.source:
-                raise DataValidationError("Entity source is required")
-                
+        """Validate a parsed entity: it must have a name, an ID and a source."""
+        if entity.name and entity.name.strip() and entity.id and entity.id.strip() and entity.source:
             return True
             
-        except Exception as e:
-            self.logger.warning("Entity validation failed", entity_id=entity.id, error=str(e))
-            return False
-            
+        # Work out the reason only on the failure path
+        if not entity.name or not entity.name.strip():
+            error = "Entity name is required"
+        elif not entity.id or not entity.id.strip():
+            error = "Entity ID is required"
+        else:
+            error = "Entity source is required"
+        self.logger.warning("Entity validation failed", entity_id=entity.id, error=error)
+        return False
+        
     async def crawl(self) -> CrawlResult:
         """Main crawl method that orchestrates the data collection process."""
         start_time = datetime.utcnow()
         entities: List[SanctionEntity] = []
         errors: List[str] = []
+        duplicates = 0
         
         self.logger.info("Starting crawl", source=self.config.source)
         
@@ -144,12 +311,20 @@ class BaseCrawler(ABC):
             # Fetch raw data
             raw_data = await self._fetch_data()
             
-            # Process data
-            async for entity in self._process_data(raw_data):
-                if self._validate_entity(entity):
-                    entities.append(entity)
-                else:
-                    errors.append(f"Validation failed for entity: {entity.id}")
+            if hasattr(raw_data, '__aiter__'):
+                parsed = await self._parse_stream(raw_data)
+            else:
+                parsed = await self._parse_raw_data(raw_data)
+            unique = self._drop_duplicates(parsed)
+            duplicates = len(parsed) - len(unique)
+            
+            entities = [entity for entity in unique if self._validate_entity(entity)]
+            if len(entities) != len(unique):
+                kept = set(map(id, entities))
+                errors.extend(
+                    f"Validation failed for entity: {entity.id}"
+                    for entity in unique if id(entity) not in kept
+                )
                     
         except Exception as e:
             error_msg = f"Crawl failed for {self.config.source}: {str(e)}"
@@ -157,6 +332,10 @@ class BaseCrawler(ABC):
             errors.append(error_msg)
             
         finally:
+            # Outside a context manager nothing else would stop the workers
+            if not self._in_context:
+                await self._shutdown_pool()
+                
             end_time = datetime.utcnow()
             duration = (end_time - start_time).total_seconds()
             
@@ -164,14 +343,13 @@ class BaseCrawler(ABC):
                 source=self.config.source,
                 entities=entities,
                 crawl_timestamp=start_time,
-                total_entities=len(entities),
-                success_count=len(entities),
                 error_count=len(errors),
                 errors=errors,
                 metadata={
                     'crawl_duration_seconds': duration,
                     'start_time': start_time.isoformat(),
                     'end_time': end_time.isoformat(),
+                    'duplicates_skipped': duplicates,
                 }
             )
             
@@ -184,21 +362,178 @@ class BaseCrawler(ABC):
             
             return result
             
-    async def _process_data(self, raw_data: Any) -> AsyncGenerator[SanctionEntity, None]:
-        """Process raw data and yield entities. Can be overridden for custom processing."""
-        if isinstance(raw_data, list):
-            for item in raw_data:
-                try:
-                    entity = self._parse_entity(item)
-                    yield entity
-                except Exception as e:
-                    self.logger.warning("Failed to parse entity", error=str(e), item=str(item)[:100])
-        else:
+    async def _parse_raw_data(self, raw_data: Any) -> List[SanctionEntity]:
+        """Parse raw data off the event loop so concurrent crawlers keep doing I/O.
+        
+        Large lists are spread over a process pool; everything else is parsed
+        in the default thread executor.
+        """
+        if self.ASYNC_PARSE and isinstance(raw_data, list):
+            return await self._process_entities_async(raw_data)
+            
+        loop = asyncio.get_running_loop()
+        workers = self._parse_workers()
+        if (
+            isinstance(raw_data, list)
+            and workers > 1
+            and len(raw_data) >= self.PARALLEL_PARSE_MIN_ITEMS
+        ):
+            size = self.PARSE_BATCH_SIZE
+            batches = [
+                [self._pack_item(item) for item in raw_data[i:i + size]]
+                for i in range(0, len(raw_data), size)
+            ]
+            results = await asyncio.gather(*map(self._parse_in_pool, batches))
+            return list(chain.from_iterable(results))
+            
+        return await loop.run_in_executor(None, self._process_entities, raw_data)
+        
+    async def _parse_stream(self, batches: AsyncIterator[List[Any]]) -> List[SanctionEntity]:
+        """Parse batches from a streaming source as they arrive.
+        
+        Each batch is handled before the next one is read. Once more than
+        PARALLEL_PARSE_MIN_ITEMS items have been seen, further batches are
+        packed and handed to a process pool, so parsing overlaps the download.
+        """
+        workers = 1 if self.ASYNC_PARSE else self._parse_workers()
+        parsed: List[SanctionEntity] = []
+        pending: List[asyncio.Future] = []
+        seen = 0
+        
+        try:
+            async for batch in batches:
+                seen += len(batch)
+                if workers > 1 and seen > self.PARALLEL_PARSE_MIN_ITEMS:
+                    packed = [self._pack_item(item) for item in batch]
+                    pending.append(asyncio.ensure_future(self._parse_in_pool(packed)))
+                else:
+                    parsed.extend(await self._parse_raw_data(batch))
+                    
+            for entities in await asyncio.gather(*pending):
+                parsed.extend(entities)
+            return parsed
+            
+        except BaseException:
+            # Don't leave workers parsing batches nobody will collect
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+            
+    async def _parse_in_pool(self, packed: List[Any]) -> List[SanctionEntity]:
+        """Parse one packed batch in the worker pool, or in-process if the pool fails."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_pool(), _parse_batch, type(self), self.config, packed
+            )
+        except Exception as e:
+            # Raw items or the crawler itself may not be picklable
+            self.logger.warning("Parallel parse failed, parsing in-process", error=str(e))
+            if isinstance(e, BrokenExecutor):
+                await self._shutdown_pool()
+                
+        return await loop.run_in_executor(None, self._parse_packed, packed)
+        
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the parse worker pool, created on first use."""
+        if self._pool is None:
+            # Workers are spawned rather than forked: this process already
+            # runs an event loop and executor threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._parse_workers(),
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return self._pool
+        
+    async def _shutdown_pool(self) -> None:
+        """Shut down the parse worker pool without blocking the event loop."""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+            
+        # Joining the workers can take a while, so it runs in a thread while
+        # crawlers sharing the loop carry on
+        options = {'cancel_futures': True} if sys.version_info >= (3, 9) else {}
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(pool.shutdown, wait=True, **options)
+        )
+        
+    def _parse_workers(self) -> int:
+        """Number of processes to parse with; 1 means parse in-process.
+        
+        The pool is opt-in through ``config.parse_workers``.
+        """
+        return self.config.parse_workers or 1
+        
+    def _pack_item(self, item: Any) -> Any:
+        """Convert a raw item to a picklable form for a parse worker."""
+        return item
+        
+    def _unpack_item(self, item: Any) -> Any:
+        """Rebuild a raw item packed by _pack_item() inside a parse worker."""
+        return item
+        
+    def _parse_packed(self, packed: List[Any]) -> List[SanctionEntity]:
+        """Unpack and parse one batch of packed raw items."""
+        return self._process_entities([self._unpack_item(item) for item in packed])
+        
+    async def _process_entities_async(self, raw_data: List[Any]) -> List[SanctionEntity]:
+        """Parse items concurrently, collecting entities in completion order."""
+        semaphore = asyncio.Semaphore(self.PARSE_CONCURRENCY)
+        
+        async def parse(item: Any) -> SanctionEntity:
+            async with semaphore:
+                return await self._parse_entity_async(item)
+                
+        tasks = [asyncio.ensure_future(parse(item)) for item in raw_data]
+        entities: List[SanctionEntity] = []
+        for future in asyncio.as_completed(tasks):
+            try:
+                entities.append(await future)
+            except Exception as e:
+                self.logger.warning("Failed to parse entity", error=str(e))
+        return entities
+        
+    async def _parse_entity_async(self, raw_item: Any) -> SanctionEntity:
+        """Parse a single raw item, awaiting any follow-up I/O it needs."""
+        return self._parse_entity(raw_item)
+        
+    @staticmethod
+    def _drop_duplicates(entities: List[SanctionEntity]) -> List[SanctionEntity]:
+        """Drop repeated (id, name, source) entries, keeping the first, before validation."""
+        seen = set()
+        unique: List[SanctionEntity] = []
+        for entity in entities:
+            key = (entity.id, entity.name, entity.source)
+            if key not in seen:
+                seen.add(key)
+                unique.append(entity)
+        return unique
+        
+    def _process_entities(self, raw_data: Any) -> List[SanctionEntity]:
+        """Parse raw data into entities in one batch. Can be overridden for custom processing."""
+        if not isinstance(raw_data, list):
             try:
-                entity = self._parse_entity(raw_data)
-                yield entity
+                return [self._parse_entity(raw_data)]
             except Exception as e:
                 self.logger.warning("Failed to parse data", error=str(e))
+                return []
+                
+        parse = self._parse_entity
+        entities: List[SanctionEntity] = []
+        append = entities.append
+        items = iter(raw_data)
+        
+        # The try block wraps the whole loop and is only re-entered after a
+        # bad item, instead of being set up once per item
+        while True:
+            try:
+                for item in items:
+                    append(parse(item))
+                return entities
+            except Exception as e:
+                self.logger.warning("Failed to parse entity", error=str(e), item=str(item)[:100])
                 
     def get_health_status(self) -> Dict[str, Any]:
         """Get health status of the crawler."""
@@ -2,8 +2,11 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, model_validator
 
 
 class EntityType(str, Enum):
@@ -45,8 +48,25 @@ class SanctionStatus(str, Enum):
     PENDING = "pending"
 
 
+# Nested models are passed through as-is when assigned or appended, never
+# copied or revalidated; parsers that use model_construct rely on this
+_ENTITY_MODEL_CONFIG = ConfigDict(
+    revalidate_instances='never',
+    validate_assignment=False,
+    extra='ignore',
+)
+
+
+@lru_cache(maxsize=None)
+def _http_url_adapter() -> TypeAdapter:
+    """Validator for HTTP(S) URLs, built on first use."""
+    return TypeAdapter(HttpUrl)
+
+
 class Address(BaseModel):
     """Address information for an entity."""
+    model_config = _ENTITY_MODEL_CONFIG
+    
     address_type: AddressType
     street: Optional[str] = None
     city: Optional[str] = None
@@ -58,6 +78,8 @@ class Address(BaseModel):
 
 class Identifier(BaseModel):
     """Identifier information for an entity."""
+    model_config = _ENTITY_MODEL_CONFIG
+    
     identifier_type: IdentifierType
     value: str
     issuing_country: Optional[str] = None
@@ -68,6 +90,8 @@ class Identifier(BaseModel):
 
 class EntityDates(BaseModel):
     """Important dates for an entity."""
+    model_config = _ENTITY_MODEL_CONFIG
+    
     birth_date: Optional[datetime] = None
     death_date: Optional[datetime] = None
     incorporation_date: Optional[datetime] = None
@@ -76,7 +100,9 @@ class EntityDates(BaseModel):
 
 class Reference(BaseModel):
     """Reference information and sources."""
-    source_url: Optional[HttpUrl] = None
+    model_config = _ENTITY_MODEL_CONFIG
+    
+    source_url: Optional[str] = None  # checked by SanctionEntity.validate_urls()
     reference_number: Optional[str] = None
     publication_date: Optional[datetime] = None
     legal_basis: Optional[str] = None
@@ -85,6 +111,8 @@ class Reference(BaseModel):
 
 class SanctionProgram(BaseModel):
     """Sanction program information."""
+    model_config = _ENTITY_MODEL_CONFIG
+    
     name: str
     authority: str
     program_type: str
@@ -95,6 +123,8 @@ class SanctionProgram(BaseModel):
 class SanctionEntity(BaseModel):
     """Core model for a sanctioned entity."""
     
+    model_config = _ENTITY_MODEL_CONFIG
+    
     # Core identification
     id: str = Field(..., description="Unique identifier for the entity")
     name: str = Field(..., description="Primary name of the entity")
@@ -131,12 +161,33 @@ class SanctionEntity(BaseModel):
     
     # Additional fields for flexible data
     additional_data: Dict[str, Any] = Field(default_factory=dict)
-
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    
+    @classmethod
+    def validated(cls, **data: Any) -> "SanctionEntity":
+        """Build an entity from untrusted input, running full validation.
+        
+        Crawlers reading schema-checked feeds use ``model_construct`` instead.
+        """
+        return cls.model_validate(data)
+        
+    def validate_urls(self) -> None:
+        """Check reference URLs, raising ``ValidationError`` for a malformed one.
+        
+        URLs are plain strings on the model so building references stays
+        cheap; call this on ingest of data whose URLs are not trusted.
+        """
+        adapter = _http_url_adapter()
+        for reference in self.references:
+            if reference.source_url:
+                adapter.validate_python(reference.source_url)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the entity as a dict of plain Python values."""
+        return self.model_dump()
+        
+    def to_json(self) -> bytes:
+        """Serialize the entity to JSON with orjson."""
+        return orjson.dumps(self.model_dump(), option=orjson.OPT_NAIVE_UTC)
         
     def add_identifier(self, identifier_type: IdentifierType, value: str, **kwargs) -> None:
         """Add an identifier to the entity."""
@@ -161,29 +212,51 @@ class SanctionEntity(BaseModel):
 
 class CrawlResult(BaseModel):
     """Result of a crawling operation."""
+    
+    model_config = ConfigDict(revalidate_instances='never', arbitrary_types_allowed=False)
+    
     source: str
     entities: List[SanctionEntity]
     crawl_timestamp: datetime = Field(default_factory=datetime.utcnow)
-    total_entities: int
-    success_count: int
+    total_entities: Optional[int] = None  # defaults to len(entities)
+    success_count: Optional[int] = None  # defaults to total_entities
     error_count: int
     errors: List[str] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    def __post_init__(self):
-        """Calculate counts after initialization."""
-        self.total_entities = len(self.entities)
-        self.success_count = self.total_entities - self.error_count
+    @model_validator(mode='after')
+    def _fill_counts(self) -> "CrawlResult":
+        """Derive counts the caller left out from the entity list.
+        
+        Entities that failed to parse or validate never reach ``entities``,
+        so every listed entity counts as a success.
+        """
+        if self.total_entities is None:
+            self.total_entities = len(self.entities)
+        if self.success_count is None:
+            self.success_count = self.total_entities
+        return self
 
 
 class CrawlerConfig(BaseModel):
-    """Configuration for crawlers."""
+    """Configuration for crawlers.
+    
+    Configs are frozen: fields can't be reassigned, so derive variants with
+    ``model_copy(update=...)``. ``headers`` and ``custom_settings`` are still
+    plain dicts shared by every crawler using the instance (including
+    ``DEFAULT_CONFIG``), so copy them rather than editing them in place.
+    """
+    
+    model_config = ConfigDict(frozen=True)
+    
     source: str
     base_url: str
     rate_limit_seconds: float = 1.0
+    max_concurrent: int = 16
     max_retries: int = 3
     timeout_seconds: int = 30
     user_agent: str = "SanctionsWatch/0.1.0"
     headers: Dict[str, str] = Field(default_factory=dict)
     verify_ssl: bool = True
+    parse_workers: Optional[int] = None  # None or 1 parses in-process
     custom_settings: Dict[str, Any] = Field(default_factory=dict)
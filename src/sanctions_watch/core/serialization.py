@@ -0,0 +1,27 @@
+"""Fast JSON serialization of crawl results with orjson."""
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+
+from .models import CrawlResult
+
+
+_DUMP_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Serialize models, the one type orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_crawl_result(result: CrawlResult) -> bytes:
+    """Serialize a crawl result, entities included, to JSON bytes.
+    
+    Models are handed to orjson as their field dicts, so no per-field
+    Python encoder runs.
+    """
+    return orjson.dumps(result, default=_default, option=_DUMP_OPTIONS)
@@ -0,0 +1,81 @@
+"""Incremental XML parsing helpers for large sanctions feeds."""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from lxml import etree
+
+
+CHUNK_SIZE = 65536
+BATCH_SIZE = 500
+
+
+async def iter_xml_elements(
+    chunks: AsyncIterator[bytes],
+    tag: Union[str, Sequence[str]],
+    batch_size: Optional[int] = None,
+    **parser_options: Any,
+) -> AsyncIterator[List[etree._Element]]:
+    """Yield batches of completed ``tag`` elements while the XML is still arriving.
+    
+    ``tag`` may also be a sequence of tags, which are yielded in document order.
+
+    Each batch is only valid until the next one is requested: the elements are
+    then cleared and detached so memory stays proportional to one batch rather
+    than the whole document. ``parser_options`` are passed on to the lxml
+    parser (e.g. ``huge_tree=True``).
+    """
+    batch_size = batch_size or BATCH_SIZE
+    parser = etree.XMLPullParser(events=('end',), tag=tag, **parser_options)
+    batch: List[etree._Element] = []
+
+    async for chunk in chunks:
+        parser.feed(chunk)
+        batch.extend(elem for _, elem in parser.read_events())
+        if len(batch) >= batch_size:
+            yield batch
+            _release(batch)
+            batch = []
+
+    parser.close()
+    batch.extend(elem for _, elem in parser.read_events())
+    if batch:
+        yield batch
+        _release(batch)
+
+
+def _release(batch: List[etree._Element]) -> None:
+    """Free parsed elements and the siblings that came before them."""
+    for elem in batch:
+        elem.clear(keep_tail=True)
+
+    last = batch[-1]
+    parent = last.getparent()
+    if parent is not None:
+        while last.getprevious() is not None:
+            del parent[0]
+
+
+def child_texts(element: etree._Element) -> Dict[str, str]:
+    """Map each direct child tag to its stripped text, keeping the first one."""
+    texts: Dict[str, str] = {}
+    for child in element.iterchildren(etree.Element):
+        text = child.text
+        if text and child.tag not in texts:
+            texts[child.tag] = text.strip()
+    return texts
+
+
+class XMLPackingMixin:
+    """Send streamed elements to parse workers as serialized XML.
+    
+    Listed before BaseCrawler in a crawler's bases so these override its
+    pass-through _pack_item() and _unpack_item().
+    """
+    
+    def _pack_item(self, item: etree._Element) -> bytes:
+        """Serialize an element so it can be sent to a parse worker."""
+        return etree.tostring(item, with_tail=False)
+        
+    def _unpack_item(self, item: bytes) -> etree._Element:
+        """Rebuild an element serialized by _pack_item()."""
+        return etree.fromstring(item)
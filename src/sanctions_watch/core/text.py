@@ -0,0 +1,46 @@
+"""Text helpers shared by the source crawlers."""
+
+import re
+from functools import lru_cache
+from typing import Callable, Mapping, Optional, Sequence, TypeVar
+
+
+T = TypeVar('T')
+
+
+def join_nonempty(sep: str, *parts: Optional[str]) -> str:
+    """Join the non-empty parts with ``sep``."""
+    # str.join builds a list from a generator anyway, so pass it one directly
+    return sep.join([part for part in parts if part])
+
+
+def keyword_matcher(
+    keywords: Sequence[str],
+    types: Sequence[T],
+    default: T,
+    exact: Optional[Mapping[str, T]] = None,
+) -> Callable[[str], T]:
+    """Build a cached function mapping a source value to the type of its keyword.
+
+    ``keywords`` are in priority order and ``types[i]`` belongs to
+    ``keywords[i]``: the first keyword found anywhere in the value wins, so
+    each alternative of the regex scans the whole string before the next.
+    Matching ignores case. ``exact`` maps common lower-cased values straight
+    to their type, skipping the regex.
+    """
+    pattern = re.compile(
+        '|'.join(f'.*?({re.escape(keyword)})' for keyword in keywords),
+        re.IGNORECASE | re.DOTALL,
+    )
+
+    # Source vocabularies are small, so every distinct value is cached
+    @lru_cache(maxsize=256)
+    def match(value: str) -> T:
+        if exact:
+            found = exact.get(value.strip().lower())
+            if found is not None:
+                return found
+        result = pattern.match(value)
+        return types[result.lastindex - 1] if result else default
+
+    return match
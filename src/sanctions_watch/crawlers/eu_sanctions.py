@@ -1,10 +1,13 @@
 """EU Sanctions crawler implementation."""
 
-import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 import re
 
+import aiohttp
+from lxml import etree
+
 from ..core.base import BaseCrawler
 from ..core.models import (
     SanctionEntity, EntityType, CrawlerConfig, 
@@ -12,9 +15,59 @@ from ..core.models import (
     EntityDates, Reference, SanctionProgram, SanctionStatus
 )
 from ..core.exceptions import CrawlerError, DataValidationError
+from ..core.streaming import XMLPackingMixin, child_texts, iter_xml_elements
+from ..core.text import join_nonempty, keyword_matcher
+
+
+# The date formats used by EU: YYYY-MM-DD, DD/MM/YYYY, DD.MM.YYYY and YYYY
+_DATE_RE = re.compile(
+    r'(?:(\d{4})-(\d{1,2})-(\d{1,2})'
+    r'|(\d{1,2})([./])(\d{1,2})\5(\d{4})'
+    r'|(\d{4}))$'
+)
+
 
+# Identifier keywords in priority order
+_ID_KEYWORDS = ('passport', 'national', 'tax', 'registration', 'id')
+_ID_TYPES = (
+    IdentifierType.PASSPORT,
+    IdentifierType.NATIONAL_ID,
+    IdentifierType.TAX_ID,
+    IdentifierType.REGISTRATION_NUMBER,
+    IdentifierType.NATIONAL_ID,
+)
+
+# Enum members used per element, bound once
+_ADDRESS_OTHER = AddressType.OTHER
+_IDENTIFIER_OTHER = IdentifierType.OTHER
+_STATUS_ACTIVE = SanctionStatus.ACTIVE
+
+_identifier_type = keyword_matcher(_ID_KEYWORDS, _ID_TYPES, _IDENTIFIER_OTHER)
 
-class EUSanctionsCrawler(BaseCrawler):
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a stripped EU date string.
+    
+    The same publication and regulation dates recur across a feed, so
+    results are cached; datetimes are immutable and safe to share.
+    """
+    match = _DATE_RE.match(date_str)
+    if match is None:
+        return None
+    
+    year, month, day, d_day, _, d_month, d_year, year_only = match.groups()
+    try:
+        if year:
+            return datetime(int(year), int(month), int(day))
+        if d_year:
+            return datetime(int(d_year), int(d_month), int(d_day))
+        return datetime(int(year_only), 1, 1)
+    except ValueError:
+        return None  # e.g. month 13
+
+
+class EUSanctionsCrawler(XMLPackingMixin, BaseCrawler):
     """Crawler for EU sanctions data from the European External Action Service."""
     
     DEFAULT_CONFIG = CrawlerConfig(
@@ -24,98 +77,99 @@ class EUSanctionsCrawler(BaseCrawler):
         timeout_seconds=60,
     )
     
-    def __init__(self, config: Optional[CrawlerConfig] = None):
+    def __init__(self, config: Optional[CrawlerConfig] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         """Initialize EU sanctions crawler."""
-        super().__init__(config or self.DEFAULT_CONFIG)
+        super().__init__(config or self.DEFAULT_CONFIG, session=session)
         
-    async def _fetch_data(self) -> ET.Element:
-        """Fetch EU sanctions XML data."""
+        # Bound once by name, so subclasses can override individual handlers
+        self._handlers: Dict[str, Callable[[etree._Element, Dict[str, Any]], None]] = {
+            tag: getattr(self, name) for tag, name in self._TAG_HANDLERS.items()
+        }
+        
+    async def _fetch_data(self) -> AsyncIterator[List[etree._Element]]:
+        """Fetch EU sanctions XML as a stream of <sanctionEntity> batches."""
+        return self._stream_entities()
+        
+    async def _stream_entities(self) -> AsyncIterator[List[etree._Element]]:
+        """Parse the EU sanctions XML incrementally, one batch at a time."""
+        count = 0
         try:
-            mock_file = self.config.custom_settings.get('mock_file') if hasattr(self.config, 'custom_settings') else None
-            if mock_file:
-                with open(mock_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            else:
-                response = await self._make_request(self.config.base_url)
-                content = await response.text()
-            
-            # Parse XML
-            root = ET.fromstring(content)
-            self.logger.info("Fetched EU sanctions XML", size_kb=len(content) // 1024)
-            
-            return root
-            
-        except ET.ParseError as e:
+            async for batch in iter_xml_elements(self._read_chunks(), 'sanctionEntity'):
+                count += len(batch)
+                yield batch
+                
+        except etree.XMLSyntaxError as e:
             raise CrawlerError(f"Failed to parse EU sanctions XML: {e}")
         except Exception as e:
             raise CrawlerError(f"Failed to fetch EU sanctions data: {e}")
             
-    def _parse_entity(self, xml_element: ET.Element) -> SanctionEntity:
-        """Parse an individual entity from EU sanctions XML."""
+        self.logger.info("Fetched EU sanctions XML", entities=count)
+            
+    def _parse_entity(self, xml_element: etree._Element) -> SanctionEntity:
+        """Parse an individual entity from EU sanctions XML.
+        
+        The subtree is walked once; each element is dispatched on its tag to a
+        handler that collects its values into ``parts``. Handlers check for
+        missing values instead of catching; anything unexpected fails the
+        entity here.
+        """
         try:
+            parts: Dict[str, Any] = {
+                'names': [],
+                'seen_names': set(),
+                'addresses': [],
+                'identifiers': [],
+                'programs': [],
+                'references': [],
+            }
+            handlers = self._handlers
+            for element in xml_element.iter(etree.Element):
+                handler = handlers.get(element.tag)
+                if handler is not None:
+                    handler(element, parts)
+                    
             # Extract basic information
-            entity_id = self._get_xml_text(xml_element, './/unitId')
-            if not entity_id:
-                entity_id = self._get_xml_text(xml_element, './/logicalId')
-                
-            names = self._extract_names(xml_element)
+            entity_id = parts.get('unitId') or parts.get('logicalId')
+            names = parts['names']
             primary_name = names[0] if names else "Unknown"
             alternative_names = names[1:] if len(names) > 1 else []
             
-            # Determine entity type
-            entity_type = self._determine_entity_type(xml_element)
+            dates = EntityDates.model_construct()
+            birth_date_str = parts.get('birthdate')
+            if birth_date_str:
+                dates.birth_date = self._parse_date(birth_date_str)
+                
+            nationality = parts.get('countryIso2Code') or None
             
-            # Create base entity
-            entity = SanctionEntity(
+            # The feed is schema-checked upstream, so models are built without
+            # validation; defaults are still filled in
+            return SanctionEntity.model_construct(
                 id=f"eu-{entity_id}",
                 name=primary_name,
                 alternative_names=alternative_names,
-                entity_type=entity_type,
+                entity_type=self._determine_entity_type(parts),
                 source=self.config.source,
                 source_id=entity_id,
-                sanction_status=SanctionStatus.ACTIVE
+                sanction_status=_STATUS_ACTIVE,
+                sanctions_programs=parts['programs'],
+                addresses=parts['addresses'],
+                identifiers=parts['identifiers'],
+                dates=dates,
+                nationality=nationality,
+                citizenship=[nationality] if nationality else [],
+                position=parts.get('function') or None,
+                references=parts['references'],
             )
             
-            # Extract additional details
-            self._extract_addresses(xml_element, entity)
-            self._extract_identifiers(xml_element, entity)
-            self._extract_dates(xml_element, entity)
-            self._extract_sanctions_info(xml_element, entity)
-            self._extract_personal_info(xml_element, entity)
-            
-            return entity
-            
         except Exception as e:
             self.logger.error("Failed to parse EU entity", error=str(e))
             raise DataValidationError(f"Failed to parse EU entity: {e}")
             
-    def _extract_names(self, xml_element: ET.Element) -> List[str]:
-        """Extract all names and aliases from XML element."""
-        names = []
-        
-        # Primary names
-        for name_elem in xml_element.findall('.//nameAlias'):
-            # Check for different name types
-            whole_name = self._get_xml_text(name_elem, 'wholeName')
-            if whole_name:
-                names.append(whole_name.strip())
-                
-            # Check for structured names (first, middle, last)
-            first_name = self._get_xml_text(name_elem, 'firstName')
-            middle_name = self._get_xml_text(name_elem, 'middleName')
-            last_name = self._get_xml_text(name_elem, 'lastName')
-            
-            if any([first_name, middle_name, last_name]):
-                full_name = ' '.join(filter(None, [first_name, middle_name, last_name]))
-                if full_name and full_name not in names:
-                    names.append(full_name.strip())
-                    
-        return names
-        
-    def _determine_entity_type(self, xml_element: ET.Element) -> EntityType:
-        """Determine entity type from XML element."""
+    def _determine_entity_type(self, parts: Dict[str, Any]) -> EntityType:
+        """Determine entity type from the collected entity parts."""
         # Check for explicit entity type indicators
-        subject_type = self._get_xml_text(xml_element, './/subjectType')
+        subject_type = parts.get('subjectType')
         
         if subject_type:
             subject_type_lower = subject_type.lower()
@@ -127,179 +181,133 @@ class EUSanctionsCrawler(BaseCrawler):
                 return EntityType.VESSEL
                 
         # Fallback: check for birth date (indicates person)
-        birth_date = xml_element.find('.//birthdate')
-        if birth_date is not None:
+        if parts.get('has_birthdate'):
             return EntityType.PERSON
             
         # Check for registration info (indicates entity)
-        registration = xml_element.find('.//identification')
-        if registration is not None:
+        if parts.get('has_identification'):
             return EntityType.ENTITY
             
         return EntityType.UNKNOWN
         
-    def _extract_addresses(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
-        """Extract address information."""
-        for address_elem in xml_element.findall('.//address'):
-            try:
-                # Get address components
-                street = self._get_xml_text(address_elem, 'street')
-                city = self._get_xml_text(address_elem, 'city')
-                state = self._get_xml_text(address_elem, 'stateProvince')
-                postal_code = self._get_xml_text(address_elem, 'zipCode')
-                country = self._get_xml_text(address_elem, 'country')
-                
-                # Create full address string
-                address_parts = [street, city, state, postal_code, country]
-                full_address = ', '.join(filter(None, address_parts))
-                
-                address = Address(
-                    address_type=AddressType.OTHER,  # EU doesn't specify address type
-                    street=street,
-                    city=city,
-                    state_province=state,
-                    postal_code=postal_code,
-                    country=country,
-                    full_address=full_address if full_address else None
-                )
-                
-                entity.addresses.append(address)
-                
-            except Exception as e:
-                self.logger.warning("Failed to parse address", error=str(e))
-                
-    def _extract_identifiers(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
-        """Extract identification documents and numbers."""
-        for id_elem in xml_element.findall('.//identification'):
-            try:
-                id_type = self._get_xml_text(id_elem, 'identificationTypeCode')
-                id_value = self._get_xml_text(id_elem, 'number')
-                country = self._get_xml_text(id_elem, 'countryIso2Code')
-                
-                if id_value:
-                    # Map EU ID types to our enum
-                    identifier_type = self._map_identifier_type(id_type)
-                    
-                    identifier = Identifier(
-                        identifier_type=identifier_type,
-                        value=id_value,
-                        issuing_country=country
-                    )
-                    
-                    entity.identifiers.append(identifier)
-                    
-            except Exception as e:
-                self.logger.warning("Failed to parse identifier", error=str(e))
-                
-    def _extract_dates(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
-        """Extract important dates."""
-        try:
-            dates = EntityDates()
-            
-            # Birth date
-            birth_date_elem = xml_element.find('.//birthdate')
-            if birth_date_elem is not None:
-                birth_date_str = birth_date_elem.text
-                if birth_date_str:
-                    dates.birth_date = self._parse_date(birth_date_str)
-                    
-            entity.dates = dates
-            
-        except Exception as e:
-            self.logger.warning("Failed to parse dates", error=str(e))
+    def _on_first_text(self, element: etree._Element, parts: Dict[str, Any]) -> None:
+        """Keep the first text seen for a leaf tag anywhere in the entity."""
+        text = element.text
+        if text and element.tag not in parts:
+            parts[element.tag] = text.strip()
             
-    def _extract_sanctions_info(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
-        """Extract sanctions program and legal basis information."""
-        try:
-            # Extract regulation references
-            for regulation_elem in xml_element.findall('.//regulation'):
-                regulation_number = self._get_xml_text(regulation_elem, 'number')
-                publication_date = self._get_xml_text(regulation_elem, 'publicationDate')
-                
-                if regulation_number:
-                    program = SanctionProgram(
-                        name=f"EU Regulation {regulation_number}",
-                        authority="European Union",
-                        program_type="EU Sanctions",
-                        legal_basis=regulation_number
-                    )
-                    entity.sanctions_programs.append(program)
-                    
-                    # Add reference
-                    ref = Reference(
-                        reference_number=regulation_number,
-                        publication_date=self._parse_date(publication_date) if publication_date else None,
-                        legal_basis=regulation_number
-                    )
-                    entity.references.append(ref)
-                    
-        except Exception as e:
-            self.logger.warning("Failed to parse sanctions info", error=str(e))
+    def _on_birthdate(self, element: etree._Element, parts: Dict[str, Any]) -> None:
+        """Note a <birthdate>, keeping the first text seen.
+        
+        The element marks a person even when the date is only in its
+        attributes or missing entirely.
+        """
+        parts['has_birthdate'] = True
+        self._on_first_text(element, parts)
+        
+    def _on_name_alias(self, element: etree._Element, parts: Dict[str, Any]) -> None:
+        """Collect the whole and structured names of a <nameAlias>."""
+        names = parts['names']
+        seen = parts['seen_names']
+        fields = child_texts(element)
+        
+        # Field texts are already stripped; names are deduplicated via a set
+        whole_name = fields.get('wholeName')
+        if whole_name and whole_name not in seen:
+            seen.add(whole_name)
+            names.append(whole_name)
             
-    def _extract_personal_info(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
-        """Extract personal information like nationality, occupation."""
-        try:
-            # Nationality
-            nationality = self._get_xml_text(xml_element, './/countryIso2Code')
-            if nationality:
-                entity.nationality = nationality
-                entity.citizenship = [nationality]
-                
-            # Function/Position
-            function = self._get_xml_text(xml_element, './/function')
-            if function:
-                entity.position = function
+        # Check for structured names (first, middle, last)
+        first_name = fields.get('firstName')
+        middle_name = fields.get('middleName')
+        last_name = fields.get('lastName')
+        
+        if first_name or middle_name or last_name:
+            full_name = join_nonempty(' ', first_name, middle_name, last_name)
+            if full_name not in seen:
+                seen.add(full_name)
+                names.append(full_name)
                 
-        except Exception as e:
-            self.logger.warning("Failed to parse personal info", error=str(e))
+    def _on_address(self, element: etree._Element, parts: Dict[str, Any]) -> None:
+        """Collect an <address>."""
+        fields = child_texts(element)
+        street = fields.get('street')
+        city = fields.get('city')
+        state = fields.get('stateProvince')
+        postal_code = fields.get('zipCode')
+        country = fields.get('country')
+        
+        # Create full address string
+        full_address = join_nonempty(', ', street, city, state, postal_code, country)
+        
+        parts['addresses'].append(Address.model_construct(
+            address_type=_ADDRESS_OTHER,  # EU doesn't specify address type
+            street=street,
+            city=city,
+            state_province=state,
+            postal_code=postal_code,
+            country=country,
+            full_address=full_address if full_address else None
+        ))
+        
+    def _on_identification(self, element: etree._Element, parts: Dict[str, Any]) -> None:
+        """Collect an <identification> document or number."""
+        parts['has_identification'] = True
+        fields = child_texts(element)
+        id_value = fields.get('number')
+        if not id_value:
+            return
             
-    def _get_xml_text(self, element: ET.Element, xpath: str) -> Optional[str]:
-        """Safely get text from XML element."""
-        try:
-            found = element.find(xpath)
-            return found.text.strip() if found is not None and found.text else None
-        except AttributeError:
-            return None
+        # Map EU ID types to our enum
+        parts['identifiers'].append(Identifier.model_construct(
+            identifier_type=self._map_identifier_type(fields.get('identificationTypeCode')),
+            value=id_value,
+            issuing_country=fields.get('countryIso2Code')
+        ))
+        
+    def _on_regulation(self, element: etree._Element, parts: Dict[str, Any]) -> None:
+        """Collect the sanctions program and reference of a <regulation>."""
+        fields = child_texts(element)
+        regulation_number = fields.get('number')
+        if not regulation_number:
+            return
             
+        publication_date = fields.get('publicationDate')
+        parts['programs'].append(SanctionProgram.model_construct(
+            name=f"EU Regulation {regulation_number}",
+            authority="European Union",
+            program_type="EU Sanctions",
+            legal_basis=regulation_number
+        ))
+        parts['references'].append(Reference.model_construct(
+            reference_number=regulation_number,
+            publication_date=self._parse_date(publication_date) if publication_date else None,
+            legal_basis=regulation_number
+        ))
+        
+    # Tag -> handler method name, looked up once per element during the walk
+    _TAG_HANDLERS: Dict[str, str] = {
+        'nameAlias': '_on_name_alias',
+        'address': '_on_address',
+        'identification': '_on_identification',
+        'regulation': '_on_regulation',
+        'birthdate': '_on_birthdate',
+        **dict.fromkeys(
+            ('unitId', 'logicalId', 'subjectType', 'countryIso2Code', 'function'),
+            '_on_first_text',
+        ),
+    }
+    
     def _map_identifier_type(self, eu_type: Optional[str]) -> IdentifierType:
         """Map EU identifier types to our standard types."""
-        if not eu_type:
-            return IdentifierType.OTHER
-            
-        eu_type_lower = eu_type.lower()
-        
-        mapping = {
-            'passport': IdentifierType.PASSPORT,
-            'national': IdentifierType.NATIONAL_ID,
-            'tax': IdentifierType.TAX_ID,
-            'registration': IdentifierType.REGISTRATION_NUMBER,
-            'id': IdentifierType.NATIONAL_ID,
-        }
-        
-        for key, identifier_type in mapping.items():
-            if key in eu_type_lower:
-                return identifier_type
-                
-        return IdentifierType.OTHER
+        return _identifier_type(eu_type) if eu_type else _IDENTIFIER_OTHER
         
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string to datetime object."""
         if not date_str:
             return None
             
-        # Try different date formats used by EU
-        date_formats = [
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%d.%m.%Y',
-            '%Y',  # Year only
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except ValueError:
-                continue
-                
-        self.logger.warning("Failed to parse date", date_str=date_str)
-        return None
+        parsed = _parse_date_cached(date_str.strip())
+        if parsed is None:
+            self.logger.warning("Failed to parse date", date_str=date_str)
+        return parsed
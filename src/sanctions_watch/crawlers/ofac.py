@@ -1,20 +1,105 @@
 """OFAC (US Treasury) sanctions crawler implementation."""
 
-import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional
 import re
 
+import aiohttp
+from lxml import etree
+
 from ..core.base import BaseCrawler
 from ..core.models import (
     SanctionEntity, EntityType, CrawlerConfig, 
-    Address, AddressType, Identifier, IdentifierType,
-    EntityDates, Reference, SanctionProgram, SanctionStatus
+    AddressType, IdentifierType, SanctionProgram, SanctionStatus
 )
 from ..core.exceptions import CrawlerError, DataValidationError
+from ..core.streaming import XMLPackingMixin, iter_xml_elements
+from ..core.text import join_nonempty, keyword_matcher
+
+
+# Compiled text() lookups for _get_text, keyed by path and built on first
+# use. Plain strings (smart_strings=False) don't keep the parsed tree alive
+_TEXT_XPATHS: Dict[str, etree.XPath] = {}
+
+# Identifier keywords in priority order
+_ID_KEYWORDS = ('passport', 'national', 'tax', 'registration', 'swift', 'imo', 'call sign')
+_ID_TYPES = (
+    IdentifierType.PASSPORT,
+    IdentifierType.NATIONAL_ID,
+    IdentifierType.TAX_ID,
+    IdentifierType.REGISTRATION_NUMBER,
+    IdentifierType.SWIFT_BIC,
+    IdentifierType.IMO_NUMBER,
+    IdentifierType.CALL_SIGN,
+)
+
+# The most common SDN idType values (lower-cased), resolved without the regex.
+# Each entry must agree with what the keywords would give
+_ID_EXACT = {
+    'passport': IdentifierType.PASSPORT,
+    'diplomatic passport': IdentifierType.PASSPORT,
+    'national id no.': IdentifierType.NATIONAL_ID,
+    'tax id no.': IdentifierType.TAX_ID,
+    'registration id': IdentifierType.REGISTRATION_NUMBER,
+    'registration number': IdentifierType.REGISTRATION_NUMBER,
+    'vessel registration identification': IdentifierType.REGISTRATION_NUMBER,
+    'swift/bic': IdentifierType.SWIFT_BIC,
+    'call sign': IdentifierType.CALL_SIGN,
+}
+
+_SDN_TYPE_KEYWORDS = ('individual', 'entity', 'vessel', 'aircraft')
+_SDN_TYPES = (EntityType.PERSON, EntityType.ENTITY, EntityType.VESSEL, EntityType.AIRCRAFT)
+
+_identifier_type = keyword_matcher(_ID_KEYWORDS, _ID_TYPES, IdentifierType.OTHER, exact=_ID_EXACT)
+_sdn_type = keyword_matcher(_SDN_TYPE_KEYWORDS, _SDN_TYPES, None)
+
+
+# Year-only and DD/MM/YYYY dates are parsed by hand; the rest go to strptime,
+# which still tries MM/DD/YYYY when DD/MM/YYYY is out of range
+_YEAR_RE = re.compile(r'\d{4}$')
+_DMY_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})$')
+_DATE_FORMATS = (
+    '%d %b %Y',    # 01 Jan 1970
+    '%Y-%m-%d',    # 1970-01-01
+    '%m/%d/%Y',    # 01/01/1970
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a stripped OFAC date string; repeated dates are served from the cache."""
+    try:
+        if _YEAR_RE.match(date_str):
+            return datetime(int(date_str), 1, 1)
+        match = _DMY_RE.match(date_str)
+        if match is not None:
+            day, month, year = match.groups()
+            return datetime(int(year), int(month), int(day))
+    except ValueError:
+        pass
+        
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _get_text(element: etree._Element, path: str) -> Optional[str]:
+    """Get the stripped text of the first match of a path, or None.
+    
+    A free function rather than a method: it runs ~20 times per entry.
+    """
+    xpath = _TEXT_XPATHS.get(path)
+    if xpath is None:
+        xpath = _TEXT_XPATHS[path] = etree.XPath(f'{path}/text()', smart_strings=False)
+    values = xpath(element)
+    return values[0].strip() if values else None
 
 
-class OFACCrawler(BaseCrawler):
+class OFACCrawler(XMLPackingMixin, BaseCrawler):
     """Crawler for OFAC SDN (Specially Designated Nationals) list."""
     
     DEFAULT_CONFIG = CrawlerConfig(
@@ -24,275 +109,219 @@ class OFACCrawler(BaseCrawler):
         timeout_seconds=120,
     )
     
-    def __init__(self, config: Optional[CrawlerConfig] = None):
+    # Element lookups, compiled once per class
+    _XP_AKA = etree.XPath('akaList/aka')
+    _XP_ADDR = etree.XPath('addressList/address')
+    _XP_ID = etree.XPath('idList/id')
+    _XP_PROGRAM = etree.XPath('programList/program/text()', smart_strings=False)
+    _XP_DOB = etree.XPath('dateOfBirthList//dateOfBirth/text()', smart_strings=False)
+    
+    def __init__(self, config: Optional[CrawlerConfig] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         """Initialize OFAC crawler."""
-        super().__init__(config or self.DEFAULT_CONFIG)
+        super().__init__(config or self.DEFAULT_CONFIG, session=session)
+        
+        # A few dozen programs are shared by every entity, so each is built once
+        self._program_cache: Dict[str, SanctionProgram] = {}
         
-    async def _fetch_data(self) -> ET.Element:
-        """Fetch OFAC SDN XML data."""
+    async def _fetch_data(self) -> AsyncIterator[List[etree._Element]]:
+        """Fetch OFAC SDN XML as a stream of <sdnEntry> batches."""
+        return self._stream_entities()
+        
+    async def _stream_entities(self) -> AsyncIterator[List[etree._Element]]:
+        """Parse the OFAC SDN XML incrementally, one batch at a time."""
+        count = 0
         try:
-            # If mock file is configured, read from disk
-            mock_file = self.config.custom_settings.get('mock_file') if hasattr(self.config, 'custom_settings') else None
-            if mock_file:
-                with open(mock_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            else:
-                response = await self._make_request(self.config.base_url)
-                content = await response.text()
-            
-            # Parse XML
-            root = ET.fromstring(content)
-            self.logger.info("Fetched OFAC SDN XML", size_kb=len(content) // 1024)
-            
-            return root
-            
-        except ET.ParseError as e:
+            # The SDN file is large enough to need huge_tree
+            async for batch in iter_xml_elements(
+                self._read_chunks(), 'sdnEntry', huge_tree=True, remove_blank_text=True
+            ):
+                count += len(batch)
+                yield batch
+                
+        except etree.XMLSyntaxError as e:
             raise CrawlerError(f"Failed to parse OFAC XML: {e}")
         except Exception as e:
             raise CrawlerError(f"Failed to fetch OFAC data: {e}")
             
-    def _parse_entity(self, xml_element: ET.Element) -> SanctionEntity:
+        self.logger.info("Fetched OFAC SDN XML", entities=count)
+        
+    def _parse_entity(self, xml_element: etree._Element) -> SanctionEntity:
         """Parse an individual entity from OFAC SDN XML."""
         try:
             # Extract basic information
             entity_id = (
                 xml_element.get('uid')
-                or self._get_xml_text(xml_element, './/uid')
-                or self._get_xml_text(xml_element, './/uidNumber')
+                or _get_text(xml_element, 'uid')
+                or _get_text(xml_element, 'uidNumber')
                 or 'unknown'
             )
-            first_name = self._get_xml_text(xml_element, './/firstName')
-            last_name = self._get_xml_text(xml_element, './/lastName')
+            first_name = _get_text(xml_element, 'firstName')
+            last_name = _get_text(xml_element, 'lastName')
             
             # Construct name
             if first_name or last_name:
-                primary_name = ' '.join(filter(None, [first_name, last_name])).strip() or 'Unknown'
+                primary_name = join_nonempty(' ', first_name, last_name) or 'Unknown'
             else:
-                primary_name = self._get_xml_text(xml_element, './/title') or 'Unknown'
+                primary_name = _get_text(xml_element, 'title') or 'Unknown'
                 
             # Extract aliases
             alternative_names = self._extract_aliases(xml_element)
             
+            # Dates of birth feed both the entity type fallback and the dates
+            birth_dates = self._XP_DOB(xml_element)
+            
             # Determine entity type
-            entity_type = self._determine_entity_type(xml_element)
+            entity_type = self._determine_entity_type(xml_element, birth_dates)
             
-            # Create base entity
-            entity = SanctionEntity(
-                id=f"ofac-{entity_id}",
-                name=primary_name,
-                alternative_names=alternative_names,
-                entity_type=entity_type,
-                source=self.config.source,
-                source_id=entity_id,
-                sanction_status=SanctionStatus.ACTIVE
-            )
+            # Collect plain fields and validate the whole entity in one call
+            data: Dict[str, Any] = {
+                'id': f"ofac-{entity_id}",
+                'name': primary_name,
+                'alternative_names': alternative_names,
+                'entity_type': entity_type,
+                'source': self.config.source,
+                'source_id': entity_id,
+                'sanction_status': SanctionStatus.ACTIVE,
+                'addresses': [],
+                'identifiers': [],
+                'sanctions_programs': [],
+            }
             
             # Extract additional details
-            self._extract_addresses(xml_element, entity)
-            self._extract_identifiers(xml_element, entity)
-            self._extract_dates(xml_element, entity)
-            self._extract_sanctions_info(xml_element, entity)
-            self._extract_personal_info(xml_element, entity)
+            self._extract_addresses(xml_element, data)
+            self._extract_identifiers(xml_element, data)
+            self._extract_dates(birth_dates, data)
+            self._extract_sanctions_info(xml_element, data)
+            self._extract_personal_info(xml_element, data)
             
-            return entity
+            return SanctionEntity.model_validate(data)
             
         except Exception as e:
             self.logger.error("Failed to parse OFAC entity", error=str(e))
             raise DataValidationError(f"Failed to parse OFAC entity: {e}")
             
-    def _extract_aliases(self, xml_element: ET.Element) -> List[str]:
+    def _extract_aliases(self, xml_element: etree._Element) -> List[str]:
         """Extract aliases from OFAC XML."""
         aliases = []
+        seen = set()
         
-        for aka_elem in xml_element.findall('.//aka'):
-            aka_type = aka_elem.get('type', '').lower()
-            first_name = self._get_xml_text(aka_elem, 'firstName')
-            last_name = self._get_xml_text(aka_elem, 'lastName')
+        for aka_elem in self._XP_AKA(xml_element):
+            first_name = _get_text(aka_elem, 'firstName')
+            last_name = _get_text(aka_elem, 'lastName')
             
             if first_name and last_name:
-                alias = f"{first_name} {last_name}".strip()
-                if alias not in aliases:
+                alias = f"{first_name} {last_name}"
+                if alias not in seen:
+                    seen.add(alias)
                     aliases.append(alias)
                     
         return aliases
         
-    def _determine_entity_type(self, xml_element: ET.Element) -> EntityType:
+    def _determine_entity_type(self, xml_element: etree._Element, birth_dates: List[str]) -> EntityType:
         """Determine entity type from OFAC XML element."""
-        sdn_type = xml_element.get('sdnType', '').lower()
-        
-        if 'individual' in sdn_type:
-            return EntityType.PERSON
-        elif 'entity' in sdn_type:
-            return EntityType.ENTITY
-        elif 'vessel' in sdn_type:
-            return EntityType.VESSEL
-        elif 'aircraft' in sdn_type:
-            return EntityType.AIRCRAFT
+        entity_type = _sdn_type(xml_element.get('sdnType', ''))
+        if entity_type is not None:
+            return entity_type
             
         # Fallback: check for personal info
-        if xml_element.find('.//dateOfBirth') is not None:
+        if birth_dates:
             return EntityType.PERSON
             
         return EntityType.UNKNOWN
         
-    def _extract_addresses(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _extract_addresses(self, xml_element: etree._Element, data: Dict[str, Any]) -> None:
         """Extract address information from OFAC XML."""
-        for address_elem in xml_element.findall('.//address'):
-            try:
-                address1 = self._get_xml_text(address_elem, 'address1')
-                address2 = self._get_xml_text(address_elem, 'address2')
-                city = self._get_xml_text(address_elem, 'city')
-                state = self._get_xml_text(address_elem, 'stateOrProvince')
-                postal_code = self._get_xml_text(address_elem, 'postalCode')
-                country = self._get_xml_text(address_elem, 'country')
-                
-                # Combine address lines
-                street_parts = [address1, address2]
-                street = ', '.join(filter(None, street_parts))
-                
-                # Create full address
-                address_parts = [street, city, state, postal_code, country]
-                full_address = ', '.join(filter(None, address_parts))
-                
-                address = Address(
-                    address_type=AddressType.OTHER,
-                    street=street if street else None,
-                    city=city,
-                    state_province=state,
-                    postal_code=postal_code,
-                    country=country,
-                    full_address=full_address if full_address else None
-                )
-                
-                entity.addresses.append(address)
+        for address_elem in self._XP_ADDR(xml_element):
+            address1 = _get_text(address_elem, 'address1')
+            address2 = _get_text(address_elem, 'address2')
+            city = _get_text(address_elem, 'city')
+            state = _get_text(address_elem, 'stateOrProvince')
+            postal_code = _get_text(address_elem, 'postalCode')
+            country = _get_text(address_elem, 'country')
+            
+            full_address = join_nonempty(', ', address1, address2, city, state, postal_code, country)
+            if not full_address:
+                continue
                 
-            except Exception as e:
-                self.logger.warning("Failed to parse OFAC address", error=str(e))
+            data['addresses'].append({
+                'address_type': AddressType.OTHER,
+                'street': join_nonempty(', ', address1, address2) or None,
+                'city': city,
+                'state_province': state,
+                'postal_code': postal_code,
+                'country': country,
+                'full_address': full_address,
+            })
                 
-    def _extract_identifiers(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _extract_identifiers(self, xml_element: etree._Element, data: Dict[str, Any]) -> None:
         """Extract identification documents from OFAC XML."""
-        for id_elem in xml_element.findall('.//id'):
-            try:
-                id_type = self._get_xml_text(id_elem, 'idType')
-                id_number = self._get_xml_text(id_elem, 'idNumber')
-                country = self._get_xml_text(id_elem, 'idCountry')
-                
-                if id_number:
-                    identifier_type = self._map_identifier_type(id_type)
-                    
-                    identifier = Identifier(
-                        identifier_type=identifier_type,
-                        value=id_number,
-                        issuing_country=country
-                    )
-                    
-                    entity.identifiers.append(identifier)
-                    
-            except Exception as e:
-                self.logger.warning("Failed to parse OFAC identifier", error=str(e))
-                
-    def _extract_dates(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
-        """Extract important dates from OFAC XML."""
-        try:
-            dates = EntityDates()
+        for id_elem in self._XP_ID(xml_element):
+            id_type = _get_text(id_elem, 'idType')
+            id_number = _get_text(id_elem, 'idNumber')
+            country = _get_text(id_elem, 'idCountry')
             
-            # Date of birth
-            birth_date_elem = xml_element.find('.//dateOfBirth')
-            if birth_date_elem is not None:
-                birth_date_str = birth_date_elem.text
-                if birth_date_str:
-                    dates.birth_date = self._parse_date(birth_date_str)
-                    
-            entity.dates = dates
+            if id_number:
+                data['identifiers'].append({
+                    'identifier_type': self._map_identifier_type(id_type),
+                    'value': id_number,
+                    'issuing_country': country,
+                })
+                
+    def _extract_dates(self, birth_dates: List[str], data: Dict[str, Any]) -> None:
+        """Extract important dates from an entry's dates of birth."""
+        # Entries without a date of birth keep dates=None
+        if not birth_dates:
+            return
             
-        except Exception as e:
-            self.logger.warning("Failed to parse OFAC dates", error=str(e))
+        birth_date = self._parse_date(birth_dates[0])
+        if birth_date:
+            data['dates'] = {'birth_date': birth_date}
             
-    def _extract_sanctions_info(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _extract_sanctions_info(self, xml_element: etree._Element, data: Dict[str, Any]) -> None:
         """Extract sanctions program information from OFAC XML."""
-        try:
-            # Extract programs
-            for program_elem in xml_element.findall('.//program'):
-                program_name = program_elem.text
-                if program_name:
-                    program = SanctionProgram(
-                        name=program_name,
-                        authority="US Treasury OFAC",
-                        program_type="OFAC Sanctions",
-                        description=program_name
-                    )
-                    entity.sanctions_programs.append(program)
-                    
-        except Exception as e:
-            self.logger.warning("Failed to parse OFAC sanctions info", error=str(e))
+        # Extract programs
+        for program_name in self._XP_PROGRAM(xml_element):
+            if program_name:
+                data['sanctions_programs'].append(self._get_program(program_name))
             
-    def _extract_personal_info(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _get_program(self, name: str) -> SanctionProgram:
+        """Return the shared SanctionProgram for a program name."""
+        program = self._program_cache.get(name)
+        if program is None:
+            program = self._program_cache[name] = SanctionProgram(
+                name=name,
+                authority="US Treasury OFAC",
+                program_type="OFAC Sanctions",
+                description=name
+            )
+        return program
+        
+    def _extract_personal_info(self, xml_element: etree._Element, data: Dict[str, Any]) -> None:
         """Extract personal information from OFAC XML."""
-        try:
-            # Nationality/Citizenship
-            nationality = self._get_xml_text(xml_element, './/nationality')
-            if nationality:
-                entity.nationality = nationality
-                entity.citizenship = [nationality]
-                
-            # Title/Position
-            title = self._get_xml_text(xml_element, './/title')
-            if title:
-                entity.position = title
-                
-        except Exception as e:
-            self.logger.warning("Failed to parse OFAC personal info", error=str(e))
+        # Nationality/Citizenship
+        nationality = _get_text(xml_element, 'nationalityList/nationality/country')
+        if nationality:
+            data['nationality'] = nationality
+            data['citizenship'] = [nationality]
             
-    def _get_xml_text(self, element: ET.Element, xpath: str) -> Optional[str]:
-        """Safely get text from XML element."""
-        try:
-            found = element.find(xpath)
-            return found.text.strip() if found is not None and found.text else None
-        except AttributeError:
-            return None
+        # Title/Position
+        title = _get_text(xml_element, 'title')
+        if title:
+            data['position'] = title
             
     def _map_identifier_type(self, ofac_type: Optional[str]) -> IdentifierType:
         """Map OFAC identifier types to our standard types."""
         if not ofac_type:
             return IdentifierType.OTHER
-            
-        ofac_type_lower = ofac_type.lower()
-        
-        mapping = {
-            'passport': IdentifierType.PASSPORT,
-            'national': IdentifierType.NATIONAL_ID,
-            'tax': IdentifierType.TAX_ID,
-            'registration': IdentifierType.REGISTRATION_NUMBER,
-            'swift': IdentifierType.SWIFT_BIC,
-            'imo': IdentifierType.IMO_NUMBER,
-            'call sign': IdentifierType.CALL_SIGN,
-        }
-        
-        for key, identifier_type in mapping.items():
-            if key in ofac_type_lower:
-                return identifier_type
-                
-        return IdentifierType.OTHER
+        return _identifier_type(ofac_type)
         
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse OFAC date string to datetime object."""
         if not date_str:
             return None
             
-        # OFAC uses various date formats
-        date_formats = [
-            '%d %b %Y',    # 01 Jan 1970
-            '%Y-%m-%d',    # 1970-01-01
-            '%d/%m/%Y',    # 01/01/1970
-            '%m/%d/%Y',    # 01/01/1970
-            '%Y',          # 1970
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except ValueError:
-                continue
-                
-        self.logger.warning("Failed to parse OFAC date", date_str=date_str)
-        return None
+        parsed = _parse_date_cached(date_str.strip())
+        if parsed is None:
+            self.logger.warning("Failed to parse OFAC date", date_str=date_str)
+        return parsed
@@ -1,19 +1,104 @@
 """UK Treasury sanctions crawler implementation."""
 
-import csv
 import io
+import re
+from collections import namedtuple
 from datetime import datetime
-from typing import Any, List, Optional, Dict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
+
+import aiohttp
 
 from ..core.base import BaseCrawler
 from ..core.models import (
     SanctionEntity, EntityType, CrawlerConfig, 
-    Address, AddressType, Identifier, IdentifierType,
-    EntityDates, Reference, SanctionProgram, SanctionStatus
+    AddressType, IdentifierType, SanctionProgram, SanctionStatus
 )
 from ..core.exceptions import CrawlerError, DataValidationError
 
 
+# The CSV columns the crawler reads; rows are reduced to these, in this order
+UK_COLUMNS = (
+    'GroupID', 'GroupType',
+    'Name1', 'Name2', 'Name3', 'Name4', 'Name5', 'Name6',
+    'Address1', 'Address2', 'Address3', 'Address4', 'Address5', 'Address6',
+    'PassportDetails', 'NationalIdentificationNumber', 'DOB',
+    'Regime', 'ListedOn', 'TownOfBirth', 'CountryOfBirth', 'Position',
+)
+
+# Per-row values computed for the whole frame at once in _derive_columns
+UK_DERIVED_COLUMNS = ('EntityKind', 'PostalCode')
+
+# One stripped CSV row. Defined at module level so rows pickle for parse workers
+UKRow = namedtuple('UKRow', UK_COLUMNS + UK_DERIVED_COLUMNS)
+
+# Fetch the six name/address cells of a row in one C-level call
+_NAME_FIELDS = itemgetter(*(UK_COLUMNS.index(f'Name{i}') for i in range(1, 7)))
+_ADDRESS_FIELDS = itemgetter(*(UK_COLUMNS.index(f'Address{i}') for i in range(1, 7)))
+
+# The first 6-20 character upper-case token with a digit in it, so words like
+# 'Passport' or 'ISSUED' around the number are skipped
+_PASSPORT_RE = re.compile(r'\b(?=[A-Z]*\d)[A-Z0-9]{6,20}\b')
+
+# Year-only and DD/MM/YYYY dates are parsed by hand; the rest go to strptime
+_YEAR_RE = re.compile(r'\d{4}$')
+_DMY_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})$')
+_DATE_FORMATS = (
+    '%d-%m-%Y',    # 01-01-1970
+    '%Y-%m-%d',    # 1970-01-01
+    '%d %b %Y',    # 01 Jan 1970
+    '%b %Y',       # Jan 1970
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a stripped UK date string; repeated dates are served from the cache."""
+    # Unknown day and month are given as 00/00/YYYY
+    date_str = date_str.replace('00/00/', '01/01/')
+    try:
+        if _YEAR_RE.match(date_str):
+            return datetime(int(date_str), 1, 1)
+        match = _DMY_RE.match(date_str)
+        if match is not None:
+            day, month, year = match.groups()
+            return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+        
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _derive_columns(frame: Any) -> Any:
+    """Add the entity type and postal code of every row, column-wise in pandas."""
+    import numpy as np
+    
+    # Entity type from GroupType, falling back to PERSON when a DOB is given
+    group_type = frame['GroupType'].str.lower()
+    frame['EntityKind'] = np.select(
+        [
+            group_type.str.contains('individual', regex=False),
+            group_type.str.contains('entity|organisation'),
+            group_type.str.contains('ship|vessel'),
+            frame['DOB'] != '',
+        ],
+        [EntityType.PERSON.value, EntityType.ENTITY.value, EntityType.VESSEL.value, EntityType.PERSON.value],
+        default=EntityType.UNKNOWN.value,
+    )
+    
+    # Postal code: the first address part of 3-10 characters with a digit in it
+    address = frame.loc[:, [f'Address{i}' for i in range(1, 7)]]
+    looks_postal = address.apply(lambda part: part.str.len().between(3, 10) & part.str.contains(r'\d'))
+    frame['PostalCode'] = address.where(looks_postal).bfill(axis=1).iloc[:, 0].fillna('')
+    return frame
+
+
 class UKTreasuryCrawler(BaseCrawler):
     """Crawler for UK HM Treasury sanctions (OFSI Consolidated List)."""
     
@@ -24,24 +109,41 @@ class UKTreasuryCrawler(BaseCrawler):
         timeout_seconds=60,
     )
     
-    def __init__(self, config: Optional[CrawlerConfig] = None):
+    def __init__(self, config: Optional[CrawlerConfig] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         """Initialize UK Treasury crawler."""
-        super().__init__(config or self.DEFAULT_CONFIG)
+        super().__init__(config or self.DEFAULT_CONFIG, session=session)
+        
+        # A few dozen programs are shared by every entity, so each is built once
+        self._program_cache: Dict[str, SanctionProgram] = {}
         
-    async def _fetch_data(self) -> List[Dict[str, str]]:
+    async def _fetch_data(self) -> List[UKRow]:
         """Fetch UK Treasury sanctions CSV data."""
+        import pandas as pd
+        
         try:
-            mock_file = self.config.custom_settings.get('mock_file') if hasattr(self.config, 'custom_settings') else None
-            if mock_file:
-                with open(mock_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            else:
-                response = await self._make_request(self.config.base_url)
-                content = await response.text()
+            content = b''.join([chunk async for chunk in self._read_chunks()])
             
-            # Parse CSV
-            csv_reader = csv.DictReader(io.StringIO(content))
-            data = list(csv_reader)
+            if not content.strip():
+                return []
+                
+            # Parse CSV in C, keeping every cell as a string ('' when empty),
+            # then strip whole columns at once. Only known columns are read, so
+            # trailing delimiters and overlong rows lose their extra cells
+            # instead of shifting the row into the index or failing the parse
+            frame = pd.read_csv(
+                io.BytesIO(content),
+                dtype=str,
+                keep_default_na=False,
+                na_filter=False,
+                encoding='utf-8-sig',
+                index_col=False,
+                usecols=lambda column: column in UK_COLUMNS,
+                on_bad_lines='warn',
+            )
+            frame = frame.reindex(columns=UK_COLUMNS, fill_value='')
+            frame = _derive_columns(frame.apply(lambda column: column.str.strip()))
+            data = list(map(UKRow._make, frame.itertuples(index=False, name=None)))
             
             self.logger.info("Fetched UK Treasury CSV", rows=len(data))
             return data
@@ -49,238 +151,154 @@ class UKTreasuryCrawler(BaseCrawler):
         except Exception as e:
             raise CrawlerError(f"Failed to fetch UK Treasury data: {e}")
             
-    def _parse_entity(self, row_data: Dict[str, str]) -> SanctionEntity:
+    def _parse_entity(self, row_data: UKRow) -> SanctionEntity:
         """Parse an individual entity from UK Treasury CSV row."""
         try:
             # Extract basic information
-            entity_id = row_data.get('GroupID', '').strip()
-            name1 = row_data.get('Name1', '').strip()
-            name2 = row_data.get('Name2', '').strip()
-            name3 = row_data.get('Name3', '').strip()
-            name4 = row_data.get('Name4', '').strip()
-            name5 = row_data.get('Name5', '').strip()
-            name6 = row_data.get('Name6', '').strip()
+            entity_id = row_data.GroupID
             
             # Construct primary name and alternatives
-            names = [name for name in [name1, name2, name3, name4, name5, name6] if name]
+            names = [name for name in _NAME_FIELDS(row_data) if name]
             primary_name = names[0] if names else "Unknown"
             alternative_names = names[1:] if len(names) > 1 else []
             
-            # Determine entity type
-            entity_type = self._determine_entity_type(row_data)
+            entity_type = EntityType(row_data.EntityKind)
             
-            # Create base entity
-            entity = SanctionEntity(
-                id=f"uk-{entity_id}",
-                name=primary_name,
-                alternative_names=alternative_names,
-                entity_type=entity_type,
-                source=self.config.source,
-                source_id=entity_id,
-                sanction_status=SanctionStatus.ACTIVE
-            )
+            # Collect plain fields and validate the whole entity in one call
+            data: Dict[str, Any] = {
+                'id': f"uk-{entity_id}",
+                'name': primary_name,
+                'alternative_names': alternative_names,
+                'entity_type': entity_type,
+                'source': self.config.source,
+                'source_id': entity_id,
+                'sanction_status': SanctionStatus.ACTIVE,
+                'addresses': [],
+                'identifiers': [],
+                'sanctions_programs': [],
+                'references': [],
+            }
             
             # Extract additional details
-            self._extract_addresses(row_data, entity)
-            self._extract_identifiers(row_data, entity)
-            self._extract_dates(row_data, entity)
-            self._extract_sanctions_info(row_data, entity)
-            self._extract_personal_info(row_data, entity)
+            self._extract_addresses(row_data, data)
+            self._extract_identifiers(row_data, data)
+            self._extract_dates(row_data, data)
+            self._extract_sanctions_info(row_data, data)
+            self._extract_personal_info(row_data, data)
             
-            return entity
+            return SanctionEntity.model_validate(data)
             
         except Exception as e:
             self.logger.error("Failed to parse UK entity", error=str(e))
             raise DataValidationError(f"Failed to parse UK entity: {e}")
             
-    def _determine_entity_type(self, row_data: Dict[str, str]) -> EntityType:
-        """Determine entity type from UK Treasury CSV row."""
-        group_type = row_data.get('GroupType', '').lower()
-        
-        if 'individual' in group_type:
-            return EntityType.PERSON
-        elif 'entity' in group_type or 'organisation' in group_type:
-            return EntityType.ENTITY
-        elif 'ship' in group_type or 'vessel' in group_type:
-            return EntityType.VESSEL
-            
-        # Check for birth date (indicates person)
-        if row_data.get('DOB'):
-            return EntityType.PERSON
-            
-        return EntityType.UNKNOWN
-        
-    def _extract_addresses(self, row_data: Dict[str, str], entity: SanctionEntity) -> None:
+    def _extract_addresses(self, row_data: UKRow, data: Dict[str, Any]) -> None:
         """Extract address information from UK Treasury CSV."""
-        try:
-            # UK Treasury provides up to 6 address fields
-            address_fields = [
-                row_data.get('Address1', '').strip(),
-                row_data.get('Address2', '').strip(), 
-                row_data.get('Address3', '').strip(),
-                row_data.get('Address4', '').strip(),
-                row_data.get('Address5', '').strip(),
-                row_data.get('Address6', '').strip(),
-            ]
+        # UK Treasury provides up to 6 address fields; drop the empty ones
+        address_parts = [part for part in _ADDRESS_FIELDS(row_data) if part]
+        
+        if address_parts:
+            full_address = ', '.join(address_parts)
             
-            # Filter out empty fields
-            address_parts = [part for part in address_fields if part]
+            # Try to parse structured address
+            country = None
+            postal_code = row_data.PostalCode or None
+            city = None
             
+            # Last part is often country
             if address_parts:
-                full_address = ', '.join(address_parts)
-                
-                # Try to parse structured address
-                country = None
-                postal_code = None
-                city = None
-                
-                # Last part is often country
-                if address_parts:
-                    potential_country = address_parts[-1]
-                    if len(potential_country) <= 50:  # Reasonable country name length
-                        country = potential_country
-                        
-                # Look for postal codes in address parts
-                for part in address_parts:
-                    if self._looks_like_postal_code(part):
-                        postal_code = part
-                        break
-                        
-                address = Address(
-                    address_type=AddressType.OTHER,
-                    city=city,
-                    postal_code=postal_code,
-                    country=country,
-                    full_address=full_address
-                )
-                
-                entity.addresses.append(address)
-                
-        except Exception as e:
-            self.logger.warning("Failed to parse UK address", error=str(e))
+                potential_country = address_parts[-1]
+                if len(potential_country) <= 50:  # Reasonable country name length
+                    country = potential_country
+                    
+            data['addresses'].append({
+                'address_type': AddressType.OTHER,
+                'city': city,
+                'postal_code': postal_code,
+                'country': country,
+                'full_address': full_address,
+            })
             
-    def _extract_identifiers(self, row_data: Dict[str, str], entity: SanctionEntity) -> None:
+    def _extract_identifiers(self, row_data: UKRow, data: Dict[str, Any]) -> None:
         """Extract identification documents from UK Treasury CSV."""
-        try:
-            # Passport numbers
-            passport_details = row_data.get('PassportDetails', '').strip()
-            if passport_details:
-                # Parse passport details (format varies)
-                passport_parts = passport_details.split()
-                for part in passport_parts:
-                    if len(part) >= 6:  # Reasonable passport number length
-                        identifier = Identifier(
-                            identifier_type=IdentifierType.PASSPORT,
-                            value=part
-                        )
-                        entity.identifiers.append(identifier)
-                        break
-                        
-            # National ID numbers
-            national_id = row_data.get('NationalIdentificationNumber', '').strip()
-            if national_id:
-                identifier = Identifier(
-                    identifier_type=IdentifierType.NATIONAL_ID,
-                    value=national_id
-                )
-                entity.identifiers.append(identifier)
+        # Passport numbers
+        passport_details = row_data.PassportDetails
+        if passport_details:
+            # Free text around the number varies, so search for it
+            match = _PASSPORT_RE.search(passport_details)
+            if match:
+                data['identifiers'].append({
+                    'identifier_type': IdentifierType.PASSPORT,
+                    'value': match.group(0),
+                })
                 
-        except Exception as e:
-            self.logger.warning("Failed to parse UK identifiers", error=str(e))
+        # National ID numbers
+        national_id = row_data.NationalIdentificationNumber
+        if national_id:
+            data['identifiers'].append({
+                'identifier_type': IdentifierType.NATIONAL_ID,
+                'value': national_id,
+            })
             
-    def _extract_dates(self, row_data: Dict[str, str], entity: SanctionEntity) -> None:
+    def _extract_dates(self, row_data: UKRow, data: Dict[str, Any]) -> None:
         """Extract important dates from UK Treasury CSV."""
-        try:
-            dates = EntityDates()
+        # Date of birth; rows without one keep dates=None
+        dob = row_data.DOB
+        if not dob:
+            return
             
-            # Date of birth
-            dob = row_data.get('DOB', '').strip()
-            if dob:
-                dates.birth_date = self._parse_date(dob)
-                
-            if dates.birth_date:
-                entity.dates = dates
-                
-        except Exception as e:
-            self.logger.warning("Failed to parse UK dates", error=str(e))
+        birth_date = self._parse_date(dob)
+        if birth_date:
+            data['dates'] = {'birth_date': birth_date}
             
-    def _extract_sanctions_info(self, row_data: Dict[str, str], entity: SanctionEntity) -> None:
+    def _extract_sanctions_info(self, row_data: UKRow, data: Dict[str, Any]) -> None:
         """Extract sanctions program information from UK Treasury CSV."""
-        try:
-            # Extract regime
-            regime = row_data.get('Regime', '').strip()
-            if regime:
-                program = SanctionProgram(
-                    name=regime,
-                    authority="UK HM Treasury OFSI",
-                    program_type="UK Sanctions",
-                    description=regime
-                )
-                entity.sanctions_programs.append(program)
-                
-            # Extract listed date as reference
-            listed_on = row_data.get('ListedOn', '').strip()
-            if listed_on:
-                ref = Reference(
-                    publication_date=self._parse_date(listed_on),
-                    additional_info=f"Listed on UK sanctions list: {listed_on}"
-                )
-                entity.references.append(ref)
-                
-        except Exception as e:
-            self.logger.warning("Failed to parse UK sanctions info", error=str(e))
+        # Extract regime
+        regime = row_data.Regime
+        if regime:
+            data['sanctions_programs'].append(self._get_program(regime))
+            
+        # Extract listed date as reference
+        listed_on = row_data.ListedOn
+        if listed_on:
+            data['references'].append({
+                'publication_date': self._parse_date(listed_on),
+                'additional_info': f"Listed on UK sanctions list: {listed_on}",
+            })
             
-    def _extract_personal_info(self, row_data: Dict[str, str], entity: SanctionEntity) -> None:
+    def _get_program(self, name: str) -> SanctionProgram:
+        """Return the shared SanctionProgram for a program name."""
+        program = self._program_cache.get(name)
+        if program is None:
+            program = self._program_cache[name] = SanctionProgram(
+                name=name,
+                authority="UK HM Treasury OFSI",
+                program_type="UK Sanctions",
+                description=name
+            )
+        return program
+        
+    def _extract_personal_info(self, row_data: UKRow, data: Dict[str, Any]) -> None:
         """Extract personal information from UK Treasury CSV."""
-        try:
-            # Town of birth (often used as nationality indicator)
-            town_of_birth = row_data.get('TownOfBirth', '').strip()
-            country_of_birth = row_data.get('CountryOfBirth', '').strip()
+        # Town of birth (often used as nationality indicator)
+        town_of_birth = row_data.TownOfBirth
+        country_of_birth = row_data.CountryOfBirth
+        
+        if country_of_birth:
+            data['nationality'] = country_of_birth
+            data['citizenship'] = [country_of_birth]
             
-            if country_of_birth:
-                entity.nationality = country_of_birth
-                entity.citizenship = [country_of_birth]
-                
-            # Position
-            position = row_data.get('Position', '').strip()
-            if position:
-                entity.position = position
-                
-        except Exception as e:
-            self.logger.warning("Failed to parse UK personal info", error=str(e))
+        # Position
+        position = row_data.Position
+        if position:
+            data['position'] = position
             
-    def _looks_like_postal_code(self, text: str) -> bool:
-        """Check if text looks like a postal code."""
-        # Simple heuristics for postal codes
-        text = text.strip()
-        return (
-            len(text) >= 3 and len(text) <= 10 and
-            any(c.isdigit() for c in text)
-        )
-        
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse UK date string to datetime object."""
         if not date_str:
             return None
             
-        # UK uses various date formats
-        date_formats = [
-            '%d/%m/%Y',    # 01/01/1970
-            '%d-%m-%Y',    # 01-01-1970
-            '%Y-%m-%d',    # 1970-01-01
-            '%d %b %Y',    # 01 Jan 1970
-            '%b %Y',       # Jan 1970
-            '%Y',          # 1970
-        ]
-        
-        # Clean up date string
-        date_str = date_str.strip().replace('00/00/', '01/01/')
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-                
-        self.logger.warning("Failed to parse UK date", date_str=date_str)
-        return None
+        parsed = _parse_date_cached(date_str.strip())
+        if parsed is None:
+            self.logger.warning("Failed to parse UK date", date_str=date_str)
+        return parsed
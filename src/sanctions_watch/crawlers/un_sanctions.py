@@ -1,10 +1,14 @@
 """UN Security Council sanctions crawler implementation."""
 
-import xml.etree.ElementTree as ET
+import sys
 from datetime import datetime
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional
 import re
 
+import aiohttp
+from lxml import etree as ET
+
 from ..core.base import BaseCrawler
 from ..core.models import (
     SanctionEntity, EntityType, CrawlerConfig, 
@@ -12,9 +16,73 @@ from ..core.models import (
     EntityDates, Reference, SanctionProgram, SanctionStatus
 )
 from ..core.exceptions import CrawlerError, DataValidationError
+from ..core.streaming import XMLPackingMixin, child_texts, iter_xml_elements
+from ..core.text import join_nonempty, keyword_matcher
+
+
+# Identifier keywords in priority order
+_ID_KEYWORDS = ('passport', 'national', 'identity', 'tax', 'registration')
+_ID_TYPES = (
+    IdentifierType.PASSPORT,
+    IdentifierType.NATIONAL_ID,
+    IdentifierType.NATIONAL_ID,
+    IdentifierType.TAX_ID,
+    IdentifierType.REGISTRATION_NUMBER,
+)
+_identifier_type = keyword_matcher(_ID_KEYWORDS, _ID_TYPES, IdentifierType.OTHER)
+
+# The date formats used by UN: YYYY-MM-DD, DD Mon YYYY and YYYY, told apart
+# by one match and built from the groups without strptime
+_DATE_RE = re.compile(
+    r'(?:(\d{4})-(\d{1,2})-(\d{1,2})'
+    r'|(\d{1,2}) ([A-Za-z]{3}) (\d{4})'
+    r'|(\d{4}))$'
+)
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1
+    )
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a stripped UN date string; repeated dates are served from the cache."""
+    match = _DATE_RE.match(date_str)
+    if match is None:
+        return None
+        
+    year, month, day, day_b, month_b, year_b, year_only = match.groups()
+    try:
+        if year:
+            return datetime(int(year), int(month), int(day))
+        if year_b:
+            month_number = _MONTHS.get(month_b.lower())
+            return datetime(int(year_b), month_number, int(day_b)) if month_number else None
+        return datetime(int(year_only), 1, 1)
+    except ValueError:
+        # Out-of-range day, month or year
+        return None
+
 
+@lru_cache(maxsize=None)
+def _tag_entity_type(tag: str) -> EntityType:
+    """Entity type implied by a record's tag (INDIVIDUAL, ENTITY, ...)."""
+    tag = tag.lower()
+    if 'individual' in tag:
+        return EntityType.PERSON
+    if 'entity' in tag:
+        return EntityType.ENTITY
+    return EntityType.UNKNOWN
 
-class UNSanctionsCrawler(BaseCrawler):
+
+def _child_text(element: ET._Element, tag: str) -> Optional[str]:
+    """Get the stripped text of the first ``tag`` child, or None."""
+    child = element.find(tag)
+    return child.text.strip() if child is not None and child.text else None
+
+
+class UNSanctionsCrawler(XMLPackingMixin, BaseCrawler):
     """Crawler for UN Security Council Consolidated Sanctions List."""
     
     DEFAULT_CONFIG = CrawlerConfig(
@@ -24,54 +92,68 @@ class UNSanctionsCrawler(BaseCrawler):
         timeout_seconds=90,
     )
     
-    def __init__(self, config: Optional[CrawlerConfig] = None):
+    # Element lookups, compiled once per class. Each matches both the
+    # individual and the entity flavour in one sweep over the record's direct
+    # children; a './/A | .//B' union would walk the subtree once per branch
+    _XP_ALIAS = ET.XPath('*[self::INDIVIDUAL_ALIAS or self::ENTITY_ALIAS]')
+    _XP_ADDR = ET.XPath('*[self::INDIVIDUAL_ADDRESS or self::ENTITY_ADDRESS]')
+    _XP_DOC = ET.XPath('*[self::INDIVIDUAL_DOCUMENT or self::ENTITY_DOCUMENT]')
+    
+    def __init__(self, config: Optional[CrawlerConfig] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         """Initialize UN sanctions crawler."""
-        super().__init__(config or self.DEFAULT_CONFIG)
+        super().__init__(config or self.DEFAULT_CONFIG, session=session)
+        
+        # A handful of committees are shared by every record, so each program is built once
+        self._program_cache: Dict[str, SanctionProgram] = {}
+        
+    async def _fetch_data(self) -> AsyncIterator[List[ET._Element]]:
+        """Fetch UN sanctions XML as a stream of <INDIVIDUAL>/<ENTITY> batches."""
+        return self._stream_entities()
         
-    async def _fetch_data(self) -> ET.Element:
-        """Fetch UN sanctions XML data."""
+    async def _stream_entities(self) -> AsyncIterator[List[ET._Element]]:
+        """Parse the UN sanctions XML incrementally, one batch at a time."""
+        count = 0
         try:
-            mock_file = self.config.custom_settings.get('mock_file') if hasattr(self.config, 'custom_settings') else None
-            if mock_file:
-                with open(mock_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            else:
-                response = await self._make_request(self.config.base_url)
-                content = await response.text()
-            
-            # Parse XML
-            root = ET.fromstring(content)
-            self.logger.info("Fetched UN sanctions XML", size_kb=len(content) // 1024)
-            
-            return root
-            
-        except ET.ParseError as e:
+            async for batch in iter_xml_elements(
+                self._read_chunks(), ('INDIVIDUAL', 'ENTITY'), huge_tree=True, collect_ids=False
+            ):
+                count += len(batch)
+                yield batch
+                
+        except ET.XMLSyntaxError as e:
             raise CrawlerError(f"Failed to parse UN sanctions XML: {e}")
         except Exception as e:
             raise CrawlerError(f"Failed to fetch UN sanctions data: {e}")
             
-    def _parse_entity(self, xml_element: ET.Element) -> SanctionEntity:
+        self.logger.info("Fetched UN sanctions XML", entities=count)
+        
+    def _parse_entity(self, xml_element: ET._Element) -> SanctionEntity:
         """Parse an individual entity from UN sanctions XML."""
         try:
+            # Index the record's own fields once; nested aliases, addresses
+            # and documents are still looked up on the tree
+            children = child_texts(xml_element)
+            
             # Extract basic information
             entity_id = (
                 xml_element.get('dataid')
-                or self._get_xml_text(xml_element, '@dataid')
-                or self._get_xml_text(xml_element, 'REFERENCE_NUMBER')
+                or children.get('REFERENCE_NUMBER')
                 or 'unknown'
             )
             
             # Extract names
-            names = self._extract_names(xml_element)
+            names = self._extract_names(xml_element, children)
             if not names:
                 # Fallback for simple mock inputs
                 names = [
-                    ' '.join(filter(None, [
-                        self._get_xml_text(xml_element, 'FIRST_NAME'),
-                        self._get_xml_text(xml_element, 'SECOND_NAME'),
-                        self._get_xml_text(xml_element, 'THIRD_NAME'),
-                        self._get_xml_text(xml_element, 'FOURTH_NAME'),
-                    ])).strip()
+                    join_nonempty(
+                        ' ',
+                        children.get('FIRST_NAME'),
+                        children.get('SECOND_NAME'),
+                        children.get('THIRD_NAME'),
+                        children.get('FOURTH_NAME'),
+                    )
                 ]
                 names = [n for n in names if n]
             primary_name = names[0] if names else "Unknown"
@@ -80,23 +162,30 @@ class UNSanctionsCrawler(BaseCrawler):
             # Determine entity type
             entity_type = self._determine_entity_type(xml_element)
             
-            # Create base entity
-            entity = SanctionEntity(
+            # Create base entity. Fields come from schema-checked XML, so
+            # validation is skipped here and left to _validate_entity
+            entity = SanctionEntity.model_construct(
                 id=f"un-{entity_id}",
                 name=primary_name,
                 alternative_names=alternative_names,
                 entity_type=entity_type,
                 source=self.config.source,
                 source_id=entity_id,
-                sanction_status=SanctionStatus.ACTIVE
+                sanction_status=SanctionStatus.ACTIVE,
+                addresses=[],
+                identifiers=[],
+                sanctions_programs=[],
+                references=[],
             )
             
             # Extract additional details
             self._extract_addresses(xml_element, entity)
             self._extract_identifiers(xml_element, entity)
-            self._extract_dates(xml_element, entity)
-            self._extract_sanctions_info(xml_element, entity)
-            self._extract_personal_info(xml_element, entity)
+            self._extract_sanctions_info(children, entity)
+            if entity_type == EntityType.PERSON:
+                # Birth dates, nationality and birthplace only exist on INDIVIDUAL records
+                self._extract_dates(children, entity)
+                self._extract_personal_info(children, entity)
             
             return entity
             
@@ -104,7 +193,7 @@ class UNSanctionsCrawler(BaseCrawler):
             self.logger.error("Failed to parse UN entity", error=str(e))
             raise DataValidationError(f"Failed to parse UN entity: {e}")
             
-    def _extract_names(self, xml_element: ET.Element) -> List[str]:
+    def _extract_names(self, xml_element: ET._Element, children: Dict[str, str]) -> List[str]:
         """Extract all names and aliases from UN XML element."""
         names = []
         
@@ -114,41 +203,26 @@ class UNSanctionsCrawler(BaseCrawler):
             'NAME_ORIGINAL_SCRIPT', 'ENTITY_NAME'
         ]
         
-        name_parts = []
-        for field in name_fields:
-            value = self._get_xml_text(xml_element, field)
-            if value:
-                name_parts.append(value)
-                
-        if name_parts:
-            full_name = ' '.join(name_parts).strip()
-            if full_name:
-                names.append(full_name)
+        full_name = join_nonempty(' ', *map(children.get, name_fields))
+        if full_name:
+            names.append(full_name)
         
         # Alternative names
-        for alias_elem in xml_element.findall('.//INDIVIDUAL_ALIAS') + xml_element.findall('.//ENTITY_ALIAS'):
-            alias_parts = []
-            for field in ['ALIAS_NAME', 'QUALITY']:
-                value = self._get_xml_text(alias_elem, field)
-                if value:
-                    alias_parts.append(value)
-                    
-            if alias_parts:
-                alias_name = ' '.join(alias_parts).strip()
-                if alias_name and alias_name not in names:
-                    names.append(alias_name)
+        for alias_elem in self._XP_ALIAS(xml_element):
+            alias_name = join_nonempty(
+                ' ', _child_text(alias_elem, 'ALIAS_NAME'), _child_text(alias_elem, 'QUALITY')
+            )
+            if alias_name and alias_name not in names:
+                names.append(alias_name)
                     
         return names
         
-    def _determine_entity_type(self, xml_element: ET.Element) -> EntityType:
+    def _determine_entity_type(self, xml_element: ET._Element) -> EntityType:
         """Determine entity type from UN XML element."""
         # UN uses different top-level elements for different types
-        tag = xml_element.tag.lower()
-        
-        if 'individual' in tag:
-            return EntityType.PERSON
-        elif 'entity' in tag:
-            return EntityType.ENTITY
+        entity_type = _tag_entity_type(xml_element.tag)
+        if entity_type is not EntityType.UNKNOWN:
+            return entity_type
             
         # Check for specific fields
         if xml_element.find('FIRST_NAME') is not None:
@@ -158,26 +232,28 @@ class UNSanctionsCrawler(BaseCrawler):
             
         return EntityType.UNKNOWN
         
-    def _extract_addresses(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _extract_addresses(self, xml_element: ET._Element, entity: SanctionEntity) -> None:
         """Extract address information from UN XML."""
-        for address_elem in xml_element.findall('.//INDIVIDUAL_ADDRESS') + xml_element.findall('.//ENTITY_ADDRESS'):
+        for address_elem in self._XP_ADDR(xml_element):
             try:
-                street = self._get_xml_text(address_elem, 'STREET')
-                city = self._get_xml_text(address_elem, 'CITY')
-                state = self._get_xml_text(address_elem, 'STATE_PROVINCE')
-                country = self._get_xml_text(address_elem, 'COUNTRY')
+                street = _child_text(address_elem, 'STREET')
+                city = _child_text(address_elem, 'CITY')
+                state = _child_text(address_elem, 'STATE_PROVINCE')
+                country = _child_text(address_elem, 'COUNTRY')
+                if country:
+                    # Country names repeat across records; share one string each
+                    country = sys.intern(country)
                 
                 # Create full address
-                address_parts = [street, city, state, country]
-                full_address = ', '.join(filter(None, address_parts))
+                full_address = join_nonempty(', ', street, city, state, country) or None
                 
-                address = Address(
+                address = Address.model_construct(
                     address_type=AddressType.OTHER,
                     street=street,
                     city=city,
                     state_province=state,
                     country=country,
-                    full_address=full_address if full_address else None
+                    full_address=full_address
                 )
                 
                 entity.addresses.append(address)
@@ -185,18 +261,20 @@ class UNSanctionsCrawler(BaseCrawler):
             except Exception as e:
                 self.logger.warning("Failed to parse UN address", error=str(e))
                 
-    def _extract_identifiers(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _extract_identifiers(self, xml_element: ET._Element, entity: SanctionEntity) -> None:
         """Extract identification documents from UN XML."""
-        for id_elem in xml_element.findall('.//INDIVIDUAL_DOCUMENT') + xml_element.findall('.//ENTITY_DOCUMENT'):
+        for id_elem in self._XP_DOC(xml_element):
             try:
-                doc_type = self._get_xml_text(id_elem, 'TYPE_OF_DOCUMENT')
-                doc_number = self._get_xml_text(id_elem, 'NUMBER')
-                country = self._get_xml_text(id_elem, 'ISSUING_COUNTRY')
+                doc_type = _child_text(id_elem, 'TYPE_OF_DOCUMENT')
+                doc_number = _child_text(id_elem, 'NUMBER')
+                country = _child_text(id_elem, 'ISSUING_COUNTRY')
+                if country:
+                    country = sys.intern(country)
                 
                 if doc_number:
                     identifier_type = self._map_identifier_type(doc_type)
                     
-                    identifier = Identifier(
+                    identifier = Identifier.model_construct(
                         identifier_type=identifier_type,
                         value=doc_number,
                         issuing_country=country
@@ -207,40 +285,31 @@ class UNSanctionsCrawler(BaseCrawler):
             except Exception as e:
                 self.logger.warning("Failed to parse UN identifier", error=str(e))
                 
-    def _extract_dates(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _extract_dates(self, children: Dict[str, str], entity: SanctionEntity) -> None:
         """Extract important dates from UN XML."""
         try:
-            dates = EntityDates()
-            
             # Date of birth
-            birth_date = self._get_xml_text(xml_element, 'INDIVIDUAL_DATE_OF_BIRTH')
+            birth_date = children.get('INDIVIDUAL_DATE_OF_BIRTH')
             if birth_date:
-                dates.birth_date = self._parse_date(birth_date)
-                
-            if dates.birth_date:
-                entity.dates = dates
+                parsed = self._parse_date(birth_date)
+                if parsed:
+                    entity.dates = EntityDates.model_construct(birth_date=parsed)
                 
         except Exception as e:
             self.logger.warning("Failed to parse UN dates", error=str(e))
             
-    def _extract_sanctions_info(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _extract_sanctions_info(self, children: Dict[str, str], entity: SanctionEntity) -> None:
         """Extract sanctions program information from UN XML."""
         try:
             # Extract committee information
-            committee = self._get_xml_text(xml_element, 'UN_LIST_TYPE')
+            committee = children.get('UN_LIST_TYPE')
             if committee:
-                program = SanctionProgram(
-                    name=f"UN {committee}",
-                    authority="United Nations Security Council",
-                    program_type="UN Sanctions",
-                    description=committee
-                )
-                entity.sanctions_programs.append(program)
+                entity.sanctions_programs.append(self._get_program(committee))
                 
             # Extract listing date
-            listed_on = self._get_xml_text(xml_element, 'LISTED_ON')
+            listed_on = children.get('LISTED_ON')
             if listed_on:
-                ref = Reference(
+                ref = Reference.model_construct(
                     publication_date=self._parse_date(listed_on),
                     additional_info=f"Listed on UN sanctions list: {listed_on}"
                 )
@@ -249,73 +318,48 @@ class UNSanctionsCrawler(BaseCrawler):
         except Exception as e:
             self.logger.warning("Failed to parse UN sanctions info", error=str(e))
             
-    def _extract_personal_info(self, xml_element: ET.Element, entity: SanctionEntity) -> None:
+    def _get_program(self, committee: str) -> SanctionProgram:
+        """Return the shared SanctionProgram for a UN committee."""
+        program = self._program_cache.get(committee)
+        if program is None:
+            program = self._program_cache[committee] = SanctionProgram.model_construct(
+                name=f"UN {committee}",
+                authority="United Nations Security Council",
+                program_type="UN Sanctions",
+                description=committee
+            )
+        return program
+        
+    def _extract_personal_info(self, children: Dict[str, str], entity: SanctionEntity) -> None:
         """Extract personal information from UN XML."""
         try:
             # Nationality
-            nationality = self._get_xml_text(xml_element, 'NATIONALITY')
+            nationality = children.get('NATIONALITY')
             if nationality:
+                nationality = sys.intern(nationality)
                 entity.nationality = nationality
                 entity.citizenship = [nationality]
                 
             # Place of birth (can indicate nationality)
-            place_of_birth = self._get_xml_text(xml_element, 'PLACE_OF_BIRTH')
+            place_of_birth = children.get('PLACE_OF_BIRTH')
             if place_of_birth and not entity.nationality:
                 entity.nationality = place_of_birth
                 
         except Exception as e:
             self.logger.warning("Failed to parse UN personal info", error=str(e))
             
-    def _get_xml_text(self, element: ET.Element, xpath: str) -> Optional[str]:
-        """Safely get text from XML element, supports attribute lookups like '@attr'."""
-        try:
-            if xpath.startswith('@'):
-                attr = xpath[1:]
-                val = element.get(attr)
-                return val.strip() if isinstance(val, str) else val
-            found = element.find(xpath)
-            return found.text.strip() if found is not None and found.text else None
-        except Exception:
-            return None
-            
     def _map_identifier_type(self, un_type: Optional[str]) -> IdentifierType:
         """Map UN identifier types to our standard types."""
         if not un_type:
             return IdentifierType.OTHER
-            
-        un_type_lower = un_type.lower()
-        
-        mapping = {
-            'passport': IdentifierType.PASSPORT,
-            'national': IdentifierType.NATIONAL_ID,
-            'identity': IdentifierType.NATIONAL_ID,
-            'tax': IdentifierType.TAX_ID,
-            'registration': IdentifierType.REGISTRATION_NUMBER,
-        }
-        
-        for key, identifier_type in mapping.items():
-            if key in un_type_lower:
-                return identifier_type
-                
-        return IdentifierType.OTHER
+        return _identifier_type(un_type)
         
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse UN date string to datetime object."""
         if not date_str:
             return None
             
-        # UN uses various date formats
-        date_formats = [
-            '%Y-%m-%d',    # 1970-01-01
-            '%d %b %Y',    # 01 Jan 1970
-            '%Y',          # 1970
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except ValueError:
-                continue
-                
-        self.logger.warning("Failed to parse UN date", date_str=date_str)
-        return None
+        parsed = _parse_date_cached(date_str.strip())
+        if parsed is None:
+            self.logger.warning("Failed to parse UN date", date_str=date_str)
+        return parsed
@@ -1,15 +1,23 @@
 """Simple deduplication for SanctionsWatch mock data."""
-from typing import Iterable, List, Dict
+from typing import Iterable, List, Set, Tuple
 from ..core.models import SanctionEntity
 
 
+def entity_key(e: SanctionEntity) -> Tuple[str, str]:
+    """Key two entities share when they are duplicates."""
+    return (e.source, e.name.lower())
+
+
 def deduplicate_entities(entities: Iterable[SanctionEntity]) -> List[SanctionEntity]:
     """Deduplicate by (normalized name lower, source)."""
-    seen: Dict[str, SanctionEntity] = {}
+    seen: Set[Tuple[str, str]] = set()
+    add = seen.add
     result: List[SanctionEntity] = []
+    append = result.append
     for e in entities:
-        key = f"{e.source}:{e.name.lower()}"
-        if key not in seen:
-            seen[key] = e
-            result.append(e)
+        # A new key grows the set: one hash of the tuple instead of two
+        size = len(seen)
+        add(entity_key(e))
+        if len(seen) != size:
+            append(e)
     return result
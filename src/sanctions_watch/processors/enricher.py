@@ -3,17 +3,23 @@ from typing import Iterable, List
 from ..core.models import SanctionEntity, SanctionProgram
 
 
+def enrich_entity(e: SanctionEntity) -> SanctionEntity:
+    """Enrich one entity in place and return it."""
+    if not e.sanctions_programs:
+        e.add_sanction_program(name="Unknown Program", authority=e.source.upper(), program_type="general")
+    # Naive data quality score: presence of address and identifiers. Summed
+    # in whole percent so no rounding or clamping is needed (max is 100)
+    score = 0
+    if e.addresses:
+        score += 40
+    if e.identifiers:
+        score += 40
+    if e.alternative_names:
+        score += 20
+    e.data_quality_score = score / 100
+    return e
+
+
 def enrich_entities(entities: Iterable[SanctionEntity]) -> List[SanctionEntity]:
     """Add a mock program entry if missing and compute a naive quality score."""
-    enriched: List[SanctionEntity] = []
-    for e in entities:
-        if not e.sanctions_programs:
-            e.add_sanction_program(name="Unknown Program", authority=e.source.upper(), program_type="general")
-        # Naive data quality score: presence of address and identifiers
-        score = 0.0
-        score += 0.4 if e.addresses else 0.0
-        score += 0.4 if e.identifiers else 0.0
-        score += 0.2 if e.alternative_names else 0.0
-        e.data_quality_score = round(min(score, 1.0), 2)
-        enriched.append(e)
-    return enriched
+    return [enrich_entity(e) for e in entities]
@@ -0,0 +1,22 @@
+"""Single-pass post-processing for SanctionsWatch mock data."""
+from typing import Iterable, Iterator, Set, Tuple
+from ..core.models import SanctionEntity
+from .deduplicator import entity_key
+from .enricher import enrich_entity
+from .normalizer import normalize_entity
+
+
+def process_entities(entities: Iterable[SanctionEntity]) -> Iterator[SanctionEntity]:
+    """Normalize, deduplicate and enrich entities in one pass.
+    
+    Yields the same entities, in the same order, as
+    ``enrich_entities(deduplicate_entities(normalize_entities(entities)))``
+    without building the intermediate lists.
+    """
+    seen: Set[Tuple[str, str]] = set()
+    add = seen.add
+    for e in entities:
+        size = len(seen)
+        add(entity_key(normalize_entity(e)))
+        if len(seen) != size:
+            yield enrich_entity(e)
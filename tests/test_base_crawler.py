@@ -1,7 +1,11 @@
 """Test the base crawler functionality."""
 
+import asyncio
+
+import aiohttp
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from sanctions_watch.core import base
 from sanctions_watch.core.base import BaseCrawler
 from sanctions_watch.core.models import SanctionEntity, EntityType, CrawlerConfig
 
@@ -37,11 +41,11 @@ class TestBaseCrawler:
             assert crawler.session is not None
     
     @pytest.mark.asyncio
-    async def test_crawl_success(self, test_config):
+    async def test_crawl_success(self, test_config, mock_session):
         """Test successful crawl operation."""
         async with TestCrawler(test_config) as crawler:
-            # Mock the HTTP session
-            crawler.session = AsyncMock()
+            # Stub the HTTP session
+            crawler.session = mock_session
             
             result = await crawler.crawl()
             
@@ -70,3 +74,227 @@ class TestBaseCrawler:
             source="test-source"
         )
         assert crawler._validate_entity(invalid_entity) is False
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_requests(self, test_config):
+        """Test consecutive requests are spaced by the configured rate limit."""
+        crawler = TestCrawler(test_config)
+        
+        await crawler._rate_limit()
+        first_request_time = crawler.last_request_time
+        await crawler._rate_limit()
+        
+        elapsed = crawler.last_request_time - first_request_time
+        assert elapsed >= test_config.rate_limit_seconds * 0.9
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_resize_bucket(self, test_config):
+        """Test X-RateLimit-* headers resize the token bucket."""
+        crawler = TestCrawler(test_config)
+        
+        crawler._update_rate_limit({'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': '10'})
+        assert crawler._bucket_capacity == test_config.max_concurrent
+        assert crawler._refill_rate == 5.0
+        
+        crawler._update_rate_limit({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '2'})
+        assert crawler._blocked_until > 0
+    
+    @pytest.mark.asyncio
+    async def test_shared_session_not_closed(self, test_config):
+        """Test a session passed in by the caller is reused and left open."""
+        shared = AsyncMock()
+        
+        async with TestCrawler(test_config, session=shared) as crawler:
+            assert crawler.session is shared
+        
+        shared.close.assert_not_called()
+    
+    def test_process_entities_skips_bad_items(self, test_config):
+        """Test a failing item is skipped without dropping the rest of the batch."""
+        crawler = TestCrawler(test_config)
+        parse = crawler._parse_entity
+        
+        def flaky_parse(item):
+            if item == "bad":
+                raise ValueError("unparseable")
+            return parse(item)
+        
+        crawler._parse_entity = flaky_parse
+        entities = crawler._process_entities(["a", "bad", "b", "bad", "c"])
+        
+        assert len(entities) == 3
+    
+    @pytest.mark.asyncio
+    async def test_parse_raw_data_uses_process_pool(self, test_config, mock_session):
+        """Test large batches share one worker pool, shut down on exit."""
+        config = test_config.model_copy(update={'parse_workers': 2})
+        async with TestCrawler(config, session=mock_session) as crawler:
+            crawler.PARALLEL_PARSE_MIN_ITEMS = 3
+            crawler.PARSE_BATCH_SIZE = 2
+            
+            entities = await crawler._parse_raw_data(["a", "b", "c", "d", "e"])
+            pool = crawler._pool
+            await crawler._parse_raw_data(["f", "g", "h"])
+            
+            assert pool is not None and crawler._pool is pool
+        
+        assert len(entities) == 5
+        assert all(entity.source == "test-source" for entity in entities)
+        assert crawler._pool is None
+    
+    @pytest.mark.asyncio
+    async def test_bare_crawl_shuts_down_pool(self, test_config, mock_session):
+        """Test the worker pool is opt-in and a crawl outside a context manager stops it."""
+        assert TestCrawler(test_config)._parse_workers() == 1
+        
+        config = test_config.model_copy(update={'parse_workers': 2})
+        crawler = TestCrawler(config, session=mock_session)
+        crawler.PARALLEL_PARSE_MIN_ITEMS = 1
+        stopped = []
+        shutdown_pool = crawler._shutdown_pool
+        
+        async def fetch_batch():
+            return ["a", "b"]
+        
+        async def record_shutdown():
+            stopped.append(crawler._pool)
+            await shutdown_pool()
+        
+        crawler._fetch_data = fetch_batch
+        crawler._shutdown_pool = record_shutdown
+        result = await crawler.crawl()
+        
+        assert result.errors == []
+        assert stopped[-1] is not None
+        assert crawler._pool is None
+    
+    @pytest.mark.asyncio
+    async def test_parse_stream_falls_back_in_process(self, test_config, mock_session, monkeypatch):
+        """Test streamed batches are parsed in-process when the worker pool fails."""
+        # A replaced module function can't be pickled by reference
+        monkeypatch.setattr(base, "_parse_batch", lambda *args: [])
+        config = test_config.model_copy(update={'parse_workers': 2})
+        
+        async def stream():
+            for batch in (["a", "b"], ["c"], ["d", "e"]):
+                yield batch
+                
+        async with TestCrawler(config, session=mock_session) as crawler:
+            crawler.PARALLEL_PARSE_MIN_ITEMS = 1
+            entities = await crawler._parse_stream(stream())
+        
+        assert len(entities) == 5
+    
+    @pytest.mark.asyncio
+    async def test_parse_stream_cancels_pending_batches(self, test_config, mock_session):
+        """Test a failing stream cancels the batches already handed to workers."""
+        config = test_config.model_copy(update={'parse_workers': 2})
+        started = []
+        
+        async def stream():
+            yield ["a"]
+            yield ["b"]
+            await asyncio.sleep(0)
+            raise ValueError("connection lost")
+            
+        async with TestCrawler(config, session=mock_session) as crawler:
+            crawler.PARALLEL_PARSE_MIN_ITEMS = 0
+            
+            async def parse_in_pool(packed):
+                started.append(asyncio.current_task())
+                await asyncio.sleep(10)
+                
+            crawler._parse_in_pool = parse_in_pool
+            with pytest.raises(ValueError):
+                await crawler._parse_stream(stream())
+        
+        assert len(started) == 2
+        assert all(task.cancelled() for task in started)
+    
+    @pytest.mark.asyncio
+    async def test_async_parse_overlaps_items(self, test_config):
+        """Test async parsing runs items concurrently and skips failures."""
+        crawler = TestCrawler(test_config)
+        crawler.ASYNC_PARSE = True
+        parse = crawler._parse_entity
+        in_flight = 0
+        peak = 0
+        
+        async def slow_parse(item):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                if item == "bad":
+                    raise ValueError("unparseable")
+                return parse(item)
+            finally:
+                in_flight -= 1
+        
+        crawler._parse_entity_async = slow_parse
+        entities = await crawler._parse_raw_data(["a", "bad", "b", "c"])
+        
+        assert len(entities) == 3
+        assert peak > 1
+    
+    @pytest.mark.asyncio
+    async def test_crawl_records_validation_errors(self, test_config, mock_session):
+        """Test entities failing validation are reported as errors."""
+        crawler = TestCrawler(test_config)
+        crawler.session = mock_session
+        
+        async def fetch_batch():
+            return ["a", "", "b"]
+        
+        def parse(raw_data):
+            return SanctionEntity(
+                id=f"test-{raw_data}",
+                name=raw_data,
+                entity_type=EntityType.PERSON,
+                source=test_config.source
+            )
+        
+        crawler._fetch_data = fetch_batch
+        crawler._parse_entity = parse
+        result = await crawler.crawl()
+        
+        assert len(result.entities) == 2
+        assert result.errors == ["Validation failed for entity: test-"]
+    
+    def test_drop_duplicates_keeps_first(self, test_config):
+        """Test repeated entities are dropped before validation."""
+        crawler = TestCrawler(test_config)
+        first, second = crawler._parse_entity("a"), crawler._parse_entity("a")
+        other = SanctionEntity(
+            id="test-2",
+            name="Test Entity",
+            entity_type=EntityType.PERSON,
+            source=test_config.source
+        )
+    
+        unique = crawler._drop_duplicates([first, second, other])
+    
+        assert unique == [first, other]
+        assert unique[0] is first
+    
+    @pytest.mark.asyncio
+    async def test_make_request_retries_client_errors(self, test_config, monkeypatch):
+        """Test transient client errors are retried with back-off."""
+        crawler = TestCrawler(test_config)
+        response = MagicMock(status=200, headers={})
+        crawler.session = MagicMock()
+        crawler.session.get = AsyncMock(side_effect=[aiohttp.ClientError("boom"), response])
+        
+        sleeps = []
+        real_sleep = asyncio.sleep
+        
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(0)
+        
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        
+        assert await crawler._make_request("https://example.com/test") is response
+        assert crawler.session.get.await_count == 2
+        assert 4.0 in sleeps
@@ -0,0 +1,303 @@
+"""Test the source-specific crawlers against local XML/CSV files."""
+
+import pytest
+from lxml import etree
+
+from sanctions_watch.core.models import CrawlerConfig, EntityType, IdentifierType
+from sanctions_watch.core.text import keyword_matcher
+from sanctions_watch.crawlers.eu_sanctions import EUSanctionsCrawler
+from sanctions_watch.crawlers import ofac
+from sanctions_watch.crawlers.ofac import OFACCrawler
+from sanctions_watch.crawlers.uk_treasury import UKTreasuryCrawler
+from sanctions_watch.crawlers.un_sanctions import UNSanctionsCrawler
+
+
+EU_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<SANCTIONS_LIST>
+  <sanctionEntity>
+    <unitId>EU1</unitId>
+    <nameAlias><wholeName>Jane Smith</wholeName></nameAlias>
+    <identification>
+      <identificationTypeCode>PASSPORT</identificationTypeCode>
+      <number>BE123456</number>
+      <countryIso2Code>BE</countryIso2Code>
+    </identification>
+    <birthdate>1980-05-05</birthdate>
+  </sanctionEntity>
+  <sanctionEntity>
+    <unitId>EU2</unitId>
+    <nameAlias><wholeName>Acme Trading</wholeName></nameAlias>
+    <address><street>1 EU Road</street><city>Brussels</city><country>BE</country></address>
+    <regulation><number>2022/123</number><publicationDate>2022-02-23</publicationDate></regulation>
+  </sanctionEntity>
+  <sanctionEntity>
+    <unitId>EU3</unitId>
+    <nameAlias><firstName>John</firstName><lastName>Doe</lastName></nameAlias>
+  </sanctionEntity>
+</SANCTIONS_LIST>
+"""
+
+OFAC_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sdnList>
+  <sdnEntry uid="1" sdnType="Individual">
+    <firstName>John</firstName>
+    <lastName>Doe</lastName>
+    <akaList>
+      <aka type="aka"><firstName>Johnny</firstName><lastName>Doe</lastName></aka>
+    </akaList>
+    <addressList>
+      <address><address1>123 Main St</address1><city>Springfield</city><country>US</country></address>
+    </addressList>
+    <dateOfBirthList>
+      <dateOfBirthItem><dateOfBirth>1970-01-01</dateOfBirth></dateOfBirthItem>
+    </dateOfBirthList>
+    <idList>
+      <id><idType>Passport</idType><idNumber>AB1234567</idNumber><idCountry>US</idCountry></id>
+    </idList>
+    <programList><program>SDGT</program></programList>
+  </sdnEntry>
+  <sdnEntry uid="2" sdnType="Entity">
+    <title>Acme Corp</title>
+    <addressList><address/></addressList>
+    <programList><program>SDGT</program></programList>
+  </sdnEntry>
+</sdnList>
+"""
+
+UK_CSV = b"""GroupID,GroupType,Name1,Name6,Address1,Address2,Address6,PassportDetails,DOB,Regime,ListedOn,Extra
+101,Individual, Ivan , Petrov,1 Red Square,101000, Russia ,Passport 7512345 issued 2015,00/00/1965,Russia,15/03/2022,x
+102,Entity,Acme Holdings,,,,,,,Russia,,y
+"""
+
+UN_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<CONSOLIDATED_LIST>
+  <INDIVIDUALS>
+    <INDIVIDUAL dataid="UN001">
+      <FIRST_NAME>Ali</FIRST_NAME>
+      <SECOND_NAME>Hassan</SECOND_NAME>
+      <UN_LIST_TYPE>Al-Qaida</UN_LIST_TYPE>
+      <LISTED_ON>2001-10-06</LISTED_ON>
+      <NATIONALITY>QA</NATIONALITY>
+      <INDIVIDUAL_ALIAS><QUALITY>Good</QUALITY><ALIAS_NAME>Abu Ali</ALIAS_NAME></INDIVIDUAL_ALIAS>
+      <INDIVIDUAL_ADDRESS><CITY>Doha</CITY><COUNTRY>QA</COUNTRY></INDIVIDUAL_ADDRESS>
+      <INDIVIDUAL_DOCUMENT>
+        <TYPE_OF_DOCUMENT>Passport</TYPE_OF_DOCUMENT>
+        <NUMBER>Q1234567</NUMBER>
+        <ISSUING_COUNTRY>QA</ISSUING_COUNTRY>
+      </INDIVIDUAL_DOCUMENT>
+      <INDIVIDUAL_DATE_OF_BIRTH>1975-02-10</INDIVIDUAL_DATE_OF_BIRTH>
+    </INDIVIDUAL>
+    <INDIVIDUAL dataid="UN002">
+      <FIRST_NAME>Omar</FIRST_NAME>
+    </INDIVIDUAL>
+  </INDIVIDUALS>
+  <ENTITIES>
+    <ENTITY dataid="UN101">
+      <FIRST_NAME>Front Company</FIRST_NAME>
+      <ENTITY_ADDRESS><STREET>1 Port Road</STREET><COUNTRY>YE</COUNTRY></ENTITY_ADDRESS>
+    </ENTITY>
+  </ENTITIES>
+</CONSOLIDATED_LIST>
+"""
+
+
+def _mock_config(crawler_class, mock_file):
+    """Default config for a crawler, reading from a local mock file."""
+    return crawler_class.DEFAULT_CONFIG.model_copy(
+        update={'custom_settings': {'mock_file': str(mock_file)}}
+    )
+
+
+class TestEUSanctionsCrawler:
+    """Test cases for EUSanctionsCrawler."""
+    
+    @pytest.mark.asyncio
+    async def test_streams_each_entity(self, tmp_path, monkeypatch):
+        """Test every <sanctionEntity> is parsed separately across batches."""
+        monkeypatch.setattr('sanctions_watch.core.streaming.BATCH_SIZE', 2)
+        mock_file = tmp_path / "eu.xml"
+        mock_file.write_bytes(EU_XML)
+    
+        async with EUSanctionsCrawler(_mock_config(EUSanctionsCrawler, mock_file)) as crawler:
+            result = await crawler.crawl()
+    
+        assert result.errors == []
+        assert [entity.id for entity in result.entities] == ["eu-EU1", "eu-EU2", "eu-EU3"]
+    
+        jane, acme, john = result.entities
+        assert jane.entity_type == EntityType.PERSON
+        assert jane.identifiers[0].identifier_type == IdentifierType.PASSPORT
+        assert jane.dates.birth_date.year == 1980
+        assert acme.addresses[0].city == "Brussels"
+        assert acme.sanctions_programs[0].legal_basis == "2022/123"
+        assert acme.references[0].publication_date.year == 2022
+        assert john.name == "John Doe"
+    
+    @pytest.mark.parametrize("birthdate", [
+        '<birthdate birthdate="1970-01-01"/>',
+        '<birthdate/><identification><number>X1</number></identification>',
+    ])
+    def test_birthdate_without_text_marks_person(self, birthdate):
+        """Test a <birthdate> element marks a person even when it has no text."""
+        element = etree.fromstring(
+            f'<sanctionEntity><unitId>EU9</unitId>{birthdate}</sanctionEntity>'
+        )
+        
+        entity = EUSanctionsCrawler()._parse_entity(element)
+        
+        assert entity.entity_type == EntityType.PERSON
+    
+    def test_subclass_handlers_are_used(self):
+        """Test a subclass overriding a tag handler is dispatched to."""
+        class NoAddressCrawler(EUSanctionsCrawler):
+            def _on_address(self, element, parts):
+                pass
+        
+        element = etree.fromstring(EU_XML).find('sanctionEntity[unitId="EU2"]')
+        
+        assert NoAddressCrawler()._parse_entity(element).addresses == []
+        assert EUSanctionsCrawler()._parse_entity(element).addresses != []
+    
+    @pytest.mark.asyncio
+    async def test_malformed_xml_is_reported(self, tmp_path):
+        """Test a truncated feed surfaces as a crawl error."""
+        mock_file = tmp_path / "eu.xml"
+        mock_file.write_bytes(EU_XML[:200])
+    
+        async with EUSanctionsCrawler(_mock_config(EUSanctionsCrawler, mock_file)) as crawler:
+            result = await crawler.crawl()
+    
+        assert result.entities == []
+        assert "Failed to parse EU sanctions XML" in result.errors[0]
+
+
+class TestOFACCrawler:
+    """Test cases for OFACCrawler."""
+    
+    @pytest.mark.asyncio
+    async def test_streams_each_entry(self, tmp_path):
+        """Test every <sdnEntry> becomes its own entity."""
+        mock_file = tmp_path / "ofac.xml"
+        mock_file.write_bytes(OFAC_XML)
+        
+        async with OFACCrawler(_mock_config(OFACCrawler, mock_file)) as crawler:
+            result = await crawler.crawl()
+        
+        assert result.errors == []
+        john, acme = result.entities
+        assert (john.id, john.name, john.entity_type) == ("ofac-1", "John Doe", EntityType.PERSON)
+        assert john.alternative_names == ["Johnny Doe"]
+        assert john.addresses[0].full_address == "123 Main St, Springfield, US"
+        assert john.identifiers[0].identifier_type == IdentifierType.PASSPORT
+        assert john.dates.birth_date.year == 1970
+        assert [program.name for program in john.sanctions_programs] == ["SDGT"]
+        assert (acme.name, acme.entity_type) == ("Acme Corp", EntityType.ENTITY)
+        assert acme.sanctions_programs[0] is john.sanctions_programs[0]
+        assert (acme.addresses, acme.dates) == ([], None)
+    
+    def test_exact_identifier_types_match_keywords(self):
+        """Test the exact idType table agrees with the keyword regex."""
+        by_keyword = keyword_matcher(ofac._ID_KEYWORDS, ofac._ID_TYPES, IdentifierType.OTHER)
+        for ofac_type, identifier_type in ofac._ID_EXACT.items():
+            assert by_keyword(ofac_type) == identifier_type
+
+
+class TestUKTreasuryCrawler:
+    """Test cases for UKTreasuryCrawler."""
+    
+    @pytest.mark.asyncio
+    async def test_parses_csv_rows(self, tmp_path):
+        """Test CSV rows are stripped and mapped, with absent columns left empty."""
+        mock_file = tmp_path / "uk.csv"
+        mock_file.write_bytes(UK_CSV)
+        
+        async with UKTreasuryCrawler(_mock_config(UKTreasuryCrawler, mock_file)) as crawler:
+            result = await crawler.crawl()
+        
+        assert result.errors == []
+        ivan, acme = result.entities
+        assert (ivan.id, ivan.name, ivan.alternative_names) == ("uk-101", "Ivan", ["Petrov"])
+        assert ivan.entity_type == EntityType.PERSON
+        assert ivan.addresses[0].full_address == "1 Red Square, 101000, Russia"
+        assert ivan.addresses[0].postal_code == "101000"
+        assert ivan.identifiers[0].value == "7512345"
+        assert ivan.dates.birth_date.year == 1965
+        assert ivan.sanctions_programs[0].name == "Russia"
+        assert (acme.entity_type, acme.addresses, acme.identifiers) == (EntityType.ENTITY, [], [])
+    
+    @pytest.mark.asyncio
+    async def test_keeps_ragged_rows_aligned(self, tmp_path):
+        """Test trailing delimiters and overlong rows don't shift or drop rows."""
+        mock_file = tmp_path / "uk.csv"
+        mock_file.write_bytes(
+            b"GroupID,GroupType,Name1\n"
+            b"1,Individual,Bob,\n"
+            b"2,Entity,Acme,extra,cells\n"
+            b"3,Entity,Zeta\n"
+        )
+        
+        async with UKTreasuryCrawler(_mock_config(UKTreasuryCrawler, mock_file)) as crawler:
+            result = await crawler.crawl()
+        
+        assert result.errors == []
+        assert [(entity.id, entity.name) for entity in result.entities] == [
+            ("uk-1", "Bob"), ("uk-2", "Acme"), ("uk-3", "Zeta"),
+        ]
+        assert result.entities[0].entity_type == EntityType.PERSON
+
+
+class TestUNSanctionsCrawler:
+    """Test cases for UNSanctionsCrawler."""
+    
+    @pytest.mark.asyncio
+    async def test_streams_each_record(self, tmp_path, monkeypatch):
+        """Test every <INDIVIDUAL> and <ENTITY> is parsed separately across batches."""
+        monkeypatch.setattr('sanctions_watch.core.streaming.BATCH_SIZE', 2)
+        mock_file = tmp_path / "un.xml"
+        mock_file.write_bytes(UN_XML)
+        
+        async with UNSanctionsCrawler(_mock_config(UNSanctionsCrawler, mock_file)) as crawler:
+            result = await crawler.crawl()
+        
+        assert result.errors == []
+        assert [entity.id for entity in result.entities] == ["un-UN001", "un-UN002", "un-UN101"]
+        
+        ali, omar, company = result.entities
+        assert (ali.name, ali.alternative_names) == ("Ali Hassan", ["Abu Ali Good"])
+        assert ali.entity_type == EntityType.PERSON
+        assert ali.addresses[0].full_address == "Doha, QA"
+        assert ali.identifiers[0].identifier_type == IdentifierType.PASSPORT
+        assert ali.dates.birth_date.year == 1975
+        assert ali.sanctions_programs[0].name == "UN Al-Qaida"
+        assert ali.references[0].publication_date.year == 2001
+        assert ali.nationality == "QA"
+        assert omar.name == "Omar"
+        assert company.entity_type == EntityType.ENTITY
+        assert company.addresses[0].full_address == "1 Port Road, YE"
+
+
+class TestParallelParsing:
+    """Test raw items survive the trip to parse workers, for every crawler."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("crawler_class, payload, expected_ids", [
+        (EUSanctionsCrawler, EU_XML, ["eu-EU1", "eu-EU2", "eu-EU3"]),
+        (OFACCrawler, OFAC_XML, ["ofac-1", "ofac-2"]),
+        (UKTreasuryCrawler, UK_CSV, ["uk-101", "uk-102"]),
+        (UNSanctionsCrawler, UN_XML, ["un-UN001", "un-UN002", "un-UN101"]),
+    ])
+    async def test_parses_in_process_pool(self, tmp_path, monkeypatch, crawler_class, payload, expected_ids):
+        """Test items are parsed in worker processes, in order."""
+        monkeypatch.setattr('sanctions_watch.core.streaming.BATCH_SIZE', 1)
+        monkeypatch.setattr(crawler_class, 'PARALLEL_PARSE_MIN_ITEMS', 1)
+        monkeypatch.setattr(crawler_class, 'PARSE_BATCH_SIZE', 1)
+        mock_file = tmp_path / "feed"
+        mock_file.write_bytes(payload)
+        config = _mock_config(crawler_class, mock_file).model_copy(update={'parse_workers': 2})
+        
+        async with crawler_class(config) as crawler:
+            result = await crawler.crawl()
+            assert crawler._pool is not None
+        
+        assert result.errors == []
+        assert [entity.id for entity in result.entities] == expected_ids
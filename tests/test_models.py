@@ -0,0 +1,77 @@
+"""Test the core data models."""
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from sanctions_watch.core.models import CrawlResult, SanctionEntity, EntityType, Reference
+from sanctions_watch.core.serialization import dump_crawl_result
+
+
+class TestSanctionEntity:
+    """Test cases for SanctionEntity."""
+    
+    def test_validated_checks_untrusted_input(self):
+        """Test validated() coerces good input and rejects bad input."""
+        entity = SanctionEntity.validated(
+            id="x-1", name="Test Entity", entity_type="person", source="test-source"
+        )
+        assert entity.entity_type is EntityType.PERSON
+        
+        with pytest.raises(ValidationError):
+            SanctionEntity.validated(id="x-2", name="Test Entity", entity_type="nope", source="test-source")
+    
+    def test_validate_urls(self):
+        """Test reference URLs are only checked on request."""
+        entity = SanctionEntity.validated(
+            id="x-1", name="Test Entity", entity_type="person", source="test-source",
+            references=[Reference(source_url="https://example.com/list")],
+        )
+        entity.validate_urls()
+        
+        entity.references.append(Reference(source_url="not a url"))
+        with pytest.raises(ValidationError):
+            entity.validate_urls()
+    
+    def test_to_json_round_trips(self):
+        """Test to_json() emits the same values as to_dict()."""
+        entity = SanctionEntity.model_construct(
+            id="x-1", name="Test Entity", entity_type=EntityType.PERSON, source="test-source"
+        )
+        data = orjson.loads(entity.to_json())
+        
+        assert data["id"] == entity.to_dict()["id"]
+        assert data["entity_type"] == "person"
+        assert data["created_at"].endswith("+00:00")
+
+
+class TestCrawlResult:
+    """Test cases for CrawlResult."""
+    
+    def test_counts_default_to_entity_list(self):
+        """Test omitted counts are derived from the entities."""
+        entity = SanctionEntity.model_construct(
+            id="x-1", name="Test Entity", entity_type=EntityType.PERSON, source="test-source"
+        )
+        result = CrawlResult(source="test-source", entities=[entity, entity], error_count=1)
+        
+        assert result.total_entities == 2
+        assert result.success_count == 2
+        
+        explicit = CrawlResult(source="test-source", entities=[entity], total_entities=5, error_count=0)
+        assert explicit.total_entities == 5
+    
+    def test_dump_crawl_result(self):
+        """Test dump_crawl_result() serializes nested models, enums and datetimes."""
+        entity = SanctionEntity.validated(
+            id="x-1", name="Test Entity", entity_type="person", source="test-source"
+        )
+        entity.add_identifier("passport", "P123")
+        result = CrawlResult(source="test-source", entities=[entity], error_count=0)
+        
+        data = orjson.loads(dump_crawl_result(result))
+        
+        assert data["total_entities"] == 1
+        assert data["entities"][0]["entity_type"] == "person"
+        assert data["entities"][0]["identifiers"][0]["value"] == "P123"
+        assert data["crawl_timestamp"].endswith("Z")
@@ -0,0 +1,33 @@
+"""Test the entity post-processors."""
+
+from sanctions_watch.core.models import Address, AddressType, SanctionEntity, EntityType
+from sanctions_watch.processors.deduplicator import deduplicate_entities
+from sanctions_watch.processors.enricher import enrich_entities
+from sanctions_watch.processors.normalizer import normalize_entities
+from sanctions_watch.processors.pipeline import process_entities
+
+
+def _entities():
+    """A fresh batch with one duplicate that only differs by padding and case."""
+    return [
+        SanctionEntity(id="x-1", name=" Jane Smith ", entity_type=EntityType.PERSON, source="test-source",
+                       alternative_names=[" J. Smith "], addresses=[Address(address_type=AddressType.OTHER, city="Paris")]),
+        SanctionEntity(id="x-2", name="jane smith", entity_type=EntityType.PERSON, source="test-source"),
+        SanctionEntity(id="x-3", name="Acme", entity_type=EntityType.ENTITY, source="test-source"),
+    ]
+
+
+class TestProcessEntities:
+    """Test cases for the fused processing pipeline."""
+    
+    def test_matches_separate_steps(self):
+        """Test one pass gives the same result as normalize, dedupe, then enrich."""
+        expected = enrich_entities(deduplicate_entities(normalize_entities(_entities())))
+        processed = list(process_entities(_entities()))
+        
+        assert [e.model_dump(exclude={"created_at", "last_updated"}) for e in processed] == [
+            e.model_dump(exclude={"created_at", "last_updated"}) for e in expected
+        ]
+        assert [e.id for e in processed] == ["x-1", "x-3"]
+        assert processed[0].name == "Jane Smith"
+        assert processed[0].data_quality_score == 0.6